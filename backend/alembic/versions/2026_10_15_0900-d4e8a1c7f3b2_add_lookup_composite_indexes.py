@@ -0,0 +1,78 @@
+"""Add composite indexes for location, unread-count and conversation-list lookups
+
+Revision ID: d4e8a1c7f3b2
+Revises: b7af2c4d2f9e
+Create Date: 2026-10-15 09:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d4e8a1c7f3b2"
+down_revision: Union[str, None] = "b7af2c4d2f9e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Lowest id per (city, postcode); every duplicate is folded into it
+_KEEP_LOCATIONS = (
+    "SELECT city, postcode, MIN(id) AS keep_id FROM locations GROUP BY city, postcode"
+)
+
+
+def upgrade() -> None:
+    # Repoint references to duplicate locations before the unique constraint goes on
+    for table in ("users", "products", "sold_item_archive"):
+        op.execute(
+            sa.text(
+                f"UPDATE {table} t "
+                "JOIN locations l ON t.location_id = l.id "
+                f"JOIN ({_KEEP_LOCATIONS}) k ON k.city = l.city AND k.postcode = l.postcode "
+                "SET t.location_id = k.keep_id "
+                "WHERE t.location_id <> k.keep_id"
+            )
+        )
+    op.execute(
+        sa.text(
+            "DELETE l FROM locations l "
+            f"JOIN ({_KEEP_LOCATIONS}) k ON k.city = l.city AND k.postcode = l.postcode "
+            "WHERE l.id <> k.keep_id"
+        )
+    )
+    op.create_unique_constraint(
+        "uq_locations_city_postcode", "locations", ["city", "postcode"]
+    )
+    op.drop_index("ix_locations_postcode_city", table_name="locations")
+
+    op.create_index(
+        "ix_messages_conv_deleted_sender",
+        "messages",
+        ["conversation_id", "deleted_at", "sender_id"],
+        unique=False,
+    )
+
+    # Create the replacement first so the user_id foreign key always has an index
+    op.create_index(
+        "ix_conv_part_user_conv",
+        "conversation_participants",
+        ["user_id", "conversation_id"],
+        unique=False,
+    )
+    op.drop_index("ix_conv_part_user", table_name="conversation_participants")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_conv_part_user", "conversation_participants", ["user_id"], unique=False
+    )
+    op.drop_index("ix_conv_part_user_conv", table_name="conversation_participants")
+
+    op.drop_index("ix_messages_conv_deleted_sender", table_name="messages")
+
+    op.create_index(
+        "ix_locations_postcode_city", "locations", ["postcode", "city"], unique=False
+    )
+    op.drop_constraint("uq_locations_city_postcode", "locations", type_="unique")
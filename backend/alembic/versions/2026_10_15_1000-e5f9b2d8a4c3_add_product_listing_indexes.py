@@ -0,0 +1,58 @@
+"""Add composite indexes for product listing filters and sorts
+
+Revision ID: e5f9b2d8a4c3
+Revises: d4e8a1c7f3b2
+Create Date: 2026-10-15 10:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5f9b2d8a4c3"
+down_revision: Union[str, None] = "d4e8a1c7f3b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_products_status_deleted_created",
+        "products",
+        ["status", "deleted_at", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_products_status_price", "products", ["status", "price_amount"], unique=False
+    )
+    op.create_index(
+        "ix_products_seller_deleted_created",
+        "products",
+        ["seller_id", "deleted_at", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_products_category_status_created",
+        "products",
+        ["category_id", "status", "created_at"],
+        unique=False,
+    )
+
+    # The composites lead with these columns, so the single-column indexes
+    # are redundant; they are dropped after their replacements exist so the
+    # foreign keys always have an index
+    op.drop_index("ix_products_status", table_name="products")
+    op.drop_index("ix_products_seller_id", table_name="products")
+    op.drop_index("ix_products_category_id", table_name="products")
+
+
+def downgrade() -> None:
+    op.create_index("ix_products_category_id", "products", ["category_id"], unique=False)
+    op.create_index("ix_products_seller_id", "products", ["seller_id"], unique=False)
+    op.create_index("ix_products_status", "products", ["status"], unique=False)
+
+    op.drop_index("ix_products_category_status_created", table_name="products")
+    op.drop_index("ix_products_seller_deleted_created", table_name="products")
+    op.drop_index("ix_products_status_price", table_name="products")
+    op.drop_index("ix_products_status_deleted_created", table_name="products")
@@ -0,0 +1,24 @@
+"""Add index on category name for exact category filters
+
+Revision ID: f6a0c3e9b5d4
+Revises: e5f9b2d8a4c3
+Create Date: 2026-10-15 11:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f6a0c3e9b5d4"
+down_revision: Union[str, None] = "e5f9b2d8a4c3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_categories_name", "categories", ["name"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_categories_name", table_name="categories")
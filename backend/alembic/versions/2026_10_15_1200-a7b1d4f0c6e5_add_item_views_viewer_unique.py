@@ -0,0 +1,35 @@
+"""Make item views unique per product and viewer
+
+Revision ID: a7b1d4f0c6e5
+Revises: f6a0c3e9b5d4
+Create Date: 2026-10-15 12:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7b1d4f0c6e5"
+down_revision: Union[str, None] = "f6a0c3e9b5d4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep the first view of each signed-in viewer; the delete trigger adjusts views_count
+    op.execute(
+        sa.text(
+            "DELETE v FROM item_views v "
+            "JOIN item_views kept ON kept.product_id = v.product_id "
+            "AND kept.viewer_user_id = v.viewer_user_id AND kept.id < v.id"
+        )
+    )
+    op.create_unique_constraint(
+        "uq_item_views_product_viewer", "item_views", ["product_id", "viewer_user_id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_item_views_product_viewer", "item_views", type_="unique")
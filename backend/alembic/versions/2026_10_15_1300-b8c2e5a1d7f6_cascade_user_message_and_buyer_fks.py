@@ -0,0 +1,53 @@
+"""Let user deletes cascade to sent messages and null archived buyers
+
+Revision ID: b8c2e5a1d7f6
+Revises: a7b1d4f0c6e5
+Create Date: 2026-10-15 13:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b8c2e5a1d7f6"
+down_revision: Union[str, None] = "a7b1d4f0c6e5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column, ON DELETE action) for foreign keys to users.id
+_USER_FKS = (
+    ("messages", "sender_id", "CASCADE"),
+    ("sold_item_archive", "buyer_id", "SET NULL"),
+)
+
+
+def _user_fk_name(table: str, column: str) -> str:
+    # The initial schema left these constraints unnamed, so MySQL generated the names
+    for fk in sa.inspect(op.get_bind()).get_foreign_keys(table):
+        if fk["constrained_columns"] == [column] and fk["referred_table"] == "users":
+            return fk["name"]
+    raise RuntimeError(f"No foreign key from {table}.{column} to users")
+
+
+def _replace_user_fks(with_ondelete: bool) -> None:
+    for table, column, ondelete in _USER_FKS:
+        op.drop_constraint(_user_fk_name(table, column), table, type_="foreignkey")
+        op.create_foreign_key(
+            f"fk_{table}_{column}_users",
+            table,
+            "users",
+            [column],
+            ["id"],
+            ondelete=ondelete if with_ondelete else None,
+        )
+
+
+def upgrade() -> None:
+    _replace_user_fks(with_ondelete=True)
+
+
+def downgrade() -> None:
+    _replace_user_fks(with_ondelete=False)
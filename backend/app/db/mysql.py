@@ -16,9 +16,12 @@ engine = create_engine(
     settings.database_url,
     echo=False,  # SQL query logging
     pool_pre_ping=True,  # Verify connections before using
-    pool_recycle=300,  # Recycle connections after 5 minutes
-    pool_size=15,  # Connection pool size (moderate to avoid max_connections)
-    max_overflow=30,  # Max connections beyond pool_size
+    pool_recycle=settings.db_pool_recycle,  # Recycle connections well below MySQL wait_timeout
+    pool_size=settings.db_pool_size,  # Persistent connections kept open per worker
+    max_overflow=settings.db_max_overflow,  # Burst connections; pool_size + overflow = 40 request threads
+    pool_timeout=settings.db_pool_timeout,  # Seconds to wait for a free connection before failing the request
+    pool_use_lifo=settings.db_pool_use_lifo,  # Reuse the most recent connection so idle extras can be recycled
+    isolation_level=settings.db_isolation_level,  # Short request transactions without InnoDB gap locks
     connect_args={
         'connect_timeout': 10,  # Connection timeout in seconds
     }
@@ -74,7 +74,7 @@ def get_message_service(db: Session = Depends(get_db)) -> MessageService:
 
 
 # Authentication Dependencies
-async def get_current_user(
+def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     auth_service: AuthService = Depends(get_auth_service)
 ) -> User:
@@ -110,7 +110,7 @@ async def get_admin_user(current_user: User = Depends(get_current_active_user))
     return current_user
 
 
-async def get_current_user_optional(
+def get_current_user_optional(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
     auth_service: AuthService = Depends(get_auth_service)
 ) -> Optional[User]:
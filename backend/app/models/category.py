@@ -17,4 +17,7 @@ class Category(Base):
 
     parent = relationship("Category", remote_side=[id], backref="children")
 
-    __table_args__ = (Index("ix_categories_parent", "parent_id"),)
+    __table_args__ = (
+        Index("ix_categories_parent", "parent_id"),
+        Index("ix_categories_name", "name"),
+    )
@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from app.db.mysql import Base
 
@@ -18,4 +18,8 @@ class ItemView(Base):
     product = relationship("Product", back_populates="views")
     viewer = relationship("User")
 
-    __table_args__ = (Index("ix_item_views_product_time", "product_id", "viewed_at"),)
+    __table_args__ = (
+        Index("ix_item_views_product_time", "product_id", "viewed_at"),
+        # One view per signed-in viewer; anonymous (NULL) viewers are not limited
+        UniqueConstraint("product_id", "viewer_user_id", name="uq_item_views_product_viewer"),
+    )
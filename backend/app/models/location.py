@@ -1,4 +1,4 @@
-from sqlalchemy import Integer, String, Index
+from sqlalchemy import Integer, String, UniqueConstraint
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
 from app.db.mysql import Base
@@ -12,7 +12,7 @@ class Location(Base):
     postcode: Mapped[str] = mapped_column(String(32), nullable=False)
 
     __table_args__ = (
-        Index("ix_locations_postcode_city", "postcode", "city"),
+        UniqueConstraint("city", "postcode", name="uq_locations_city_postcode"),
     )
 
     users = relationship("User", back_populates="location")
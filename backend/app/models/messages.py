@@ -1,6 +1,6 @@
-from datetime import datetime, timezone
+from datetime import datetime
 
-from sqlalchemy import Text, DateTime, ForeignKey, Index, Integer
+from sqlalchemy import Text, DateTime, ForeignKey, Index, Integer, func
 from sqlalchemy.orm import relationship, mapped_column, Mapped
 
 from app.db.mysql import Base
@@ -18,12 +18,12 @@ class Conversation(Base):
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=lambda: datetime.now(timezone.utc),
+        default=func.utc_timestamp(),
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        default=func.utc_timestamp(),
+        onupdate=func.utc_timestamp(),
         index=True,
         nullable=False,
     )
@@ -57,14 +57,14 @@ class ConversationParticipant(Base):
     )
     joined_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=lambda: datetime.now(timezone.utc),
+        default=func.utc_timestamp(),
         nullable=False,
     )
 
     conversation = relationship("Conversation", back_populates="participants")
     user = relationship("User")
 
-    __table_args__ = (Index("ix_conv_part_user", "user_id"),)
+    __table_args__ = (Index("ix_conv_part_user_conv", "user_id", "conversation_id"),)
 
 
 class Message(Base):
@@ -79,14 +79,14 @@ class Message(Base):
     )
     sender_id: Mapped[int] = mapped_column(
         Integer,
-        ForeignKey("users.id"),
+        ForeignKey("users.id", ondelete="CASCADE"),
         index=True,
         nullable=False,
     )
     body: Mapped[str] = mapped_column(Text, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=lambda: datetime.now(timezone.utc),
+        default=func.utc_timestamp(),
     )
     deleted_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
@@ -98,6 +98,10 @@ class Message(Base):
         cascade="all, delete-orphan",
     )
 
+    __table_args__ = (
+        Index("ix_messages_conv_deleted_sender", "conversation_id", "deleted_at", "sender_id"),
+    )
+
 
 class MessageRead(Base):
     __tablename__ = "message_reads"
@@ -114,7 +118,7 @@ class MessageRead(Base):
     )
     read_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=lambda: datetime.now(timezone.utc),
+        default=func.utc_timestamp(),
         nullable=False,
     )
 
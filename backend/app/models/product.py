@@ -1,5 +1,5 @@
 """Product model for database operations."""
-from datetime import datetime, timezone
+from datetime import datetime
 
 from sqlalchemy import (
     String,
@@ -12,6 +12,7 @@ from sqlalchemy import (
     Index,
     Enum,
     Integer,
+    func,
 )
 from sqlalchemy.orm import relationship, mapped_column, Mapped
 
@@ -39,12 +40,12 @@ class Product(Base):
     __tablename__ = "products"
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    seller_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
+    seller_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
 
     title: Mapped[str] = mapped_column(String(200), nullable=False, index=True)
     description: Mapped[str] = mapped_column(Text, nullable=False)
 
-    category_id: Mapped[int] = mapped_column(ForeignKey("categories.id"), nullable=False, index=True)
+    category_id: Mapped[int] = mapped_column(ForeignKey("categories.id"), nullable=False)
     condition: Mapped[str] = mapped_column(ConditionEnum, nullable=False)
 
     quantity: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
@@ -55,7 +56,7 @@ class Product(Base):
     price_currency: Mapped[str | None] = mapped_column(String(3), nullable=True)
     price_type: Mapped[str] = mapped_column(PriceTypeEnum, nullable=False, default="fixed")
 
-    status: Mapped[str] = mapped_column(StatusEnum, nullable=False, default="active", index=True)
+    status: Mapped[str] = mapped_column(StatusEnum, nullable=False, default="active")
 
     width_cm: Mapped[float | None] = mapped_column(Numeric(8, 2), nullable=True)
     height_cm: Mapped[float | None] = mapped_column(Numeric(8, 2), nullable=True)
@@ -65,14 +66,15 @@ class Product(Base):
     location_id: Mapped[int] = mapped_column(ForeignKey("locations.id"), nullable=False, index=True)
     is_flagged: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
 
+    # Stamped by the database in UTC, inline in the INSERT/UPDATE
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=lambda: datetime.now(timezone.utc),
+        default=func.utc_timestamp(),
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        default=func.utc_timestamp(),
+        onupdate=func.utc_timestamp(),
     )
     sold_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     deleted_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
@@ -85,18 +87,27 @@ class Product(Base):
         "ProductImage",
         back_populates="product",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         order_by="ProductImage.sort_order",
     )
     price_changes = relationship(
         "ProductPriceHistory",
         back_populates="product",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     colors = relationship("Color", secondary="product_colors", back_populates="products")
     materials = relationship("Material", secondary="product_materials", back_populates="products")
     tags = relationship("Tag", secondary="product_tags", back_populates="products")
-    favorites = relationship("Favorite", back_populates="product", cascade="all, delete-orphan")
-    views = relationship("ItemView", back_populates="product", cascade="all, delete-orphan")
+    # Child rows carry ON DELETE CASCADE, so deleting a product never loads them;
+    # the counts live in the trigger-maintained likes_count and views_count columns,
+    # so loading either collection is an error rather than a silent full fetch
+    favorites = relationship(
+        "Favorite", back_populates="product", cascade="all, delete-orphan", passive_deletes=True, lazy="raise"
+    )
+    views = relationship(
+        "ItemView", back_populates="product", cascade="all, delete-orphan", passive_deletes=True, lazy="raise"
+    )
 
     __table_args__ = (
         CheckConstraint(
@@ -106,6 +117,11 @@ class Product(Base):
         ),
         CheckConstraint("quantity >= 0", name="ck_quantity_non_negative"),
         Index("ix_products_price_currency_amount", "price_currency", "price_amount"),
+        # Listing filters are equality on the leading columns and sort by the last
+        Index("ix_products_status_deleted_created", "status", "deleted_at", "created_at"),
+        Index("ix_products_status_price", "status", "price_amount"),
+        Index("ix_products_seller_deleted_created", "seller_id", "deleted_at", "created_at"),
+        Index("ix_products_category_status_created", "category_id", "status", "created_at"),
     )
 
     def __repr__(self) -> str:
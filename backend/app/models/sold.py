@@ -13,7 +13,7 @@ class SoldItemArchive(Base):
 
     id = Column(Integer, primary_key=True, index=True)           # sale id
     product_id = Column(Integer, ForeignKey("products.id", ondelete="SET NULL"), nullable=True, index=True)
-    buyer_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    buyer_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
 
     title = Column(String(200), nullable=False)
     category_id = Column(Integer, ForeignKey("categories.id"), nullable=False)
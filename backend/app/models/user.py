@@ -1,7 +1,7 @@
 """User model for database operations."""
-from datetime import datetime, timezone
+from datetime import datetime
 
-from sqlalchemy import String, Boolean, DateTime, ForeignKey, Integer
+from sqlalchemy import String, Boolean, DateTime, ForeignKey, Integer, func
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
 from app.db.mysql import Base
@@ -30,16 +30,16 @@ class User(Base):
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=lambda: datetime.now(timezone.utc),
+        default=func.utc_timestamp(),
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        default=func.utc_timestamp(),
+        onupdate=func.utc_timestamp(),
     )
 
     # Relationships
     location = relationship("Location", back_populates="users")
     products = relationship("Product", back_populates="seller", cascade="all, delete-orphan")
     favorites = relationship("Favorite", back_populates="user")
-    messages = relationship("Message", back_populates="sender")
+    messages = relationship("Message", back_populates="sender", passive_deletes=True)
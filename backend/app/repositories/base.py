@@ -1,6 +1,7 @@
 """Abstract base repository classes for the repository pattern."""
 from abc import ABC, abstractmethod
-from typing import List, Optional, TypeVar, Generic
+from decimal import Decimal
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, TypeVar, Generic
 from sqlalchemy.orm import Session
 
 from app.models.user import User
@@ -13,6 +14,13 @@ from app.schemas.product_schema import ProductCreate, ProductUpdate, ProductFilt
 T = TypeVar('T')
 
 
+class ProductAuthFields(NamedTuple):
+    """The product columns needed to authorize and validate a mutation."""
+    seller_id: int
+    price_amount: Optional[Decimal]
+    status: str
+
+
 class BaseRepository(Generic[T], ABC):
     """Abstract base repository providing common CRUD operations."""
     
@@ -53,6 +61,11 @@ class UserRepositoryInterface(ABC):
         """Get user by ID with location relationship loaded."""
         pass
     
+    @abstractmethod
+    def get_with_product_count(self, user_id: int) -> Optional[Tuple[User, int]]:
+        """Get user by ID with location loaded, together with their live product count."""
+        pass
+    
     @abstractmethod
     def get_by_username(self, username: str) -> Optional[User]:
         """Get user by username with location relationship loaded."""
@@ -93,6 +106,11 @@ class UserRepositoryInterface(ABC):
         """Search users by username, email, or full name."""
         pass
 
+    @abstractmethod
+    def get_page_with_total(self, skip: int = 0, limit: int = 100, search_term: Optional[str] = None, sort_field: Optional[str] = None, sort_direction: str = 'asc') -> Tuple[List[User], int]:
+        """Get a page of users, optionally searched, together with the total match count."""
+        pass
+
     @abstractmethod
     def count_total_users(self) -> int:
         """Get total count of users."""
@@ -117,6 +135,11 @@ class ProductRepositoryInterface(ABC):
         """Get product by ID with optional detailed relationships."""
         pass
     
+    @abstractmethod
+    def get_auth_fields(self, product_id: int) -> Optional[ProductAuthFields]:
+        """Get seller, price and status of a product without loading the entity."""
+        pass
+    
     @abstractmethod
     def get_all_filtered(
         self, 
@@ -130,11 +153,28 @@ class ProductRepositoryInterface(ABC):
         """Get filtered products with pagination."""
         pass
     
+    @abstractmethod
+    def get_page_with_total(
+        self,
+        filters: Optional[ProductFilter] = None,
+        skip: int = 0,
+        limit: int = 100,
+        sort_field: Optional[str] = None,
+        sort_direction: str = 'desc'
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Get a page of filtered product rows together with the total match count."""
+        pass
+    
     @abstractmethod
     def get_by_seller(self, seller_id: int, skip: int = 0, limit: int = 100) -> List[Product]:
         """Get products by seller ID."""
         pass
     
+    @abstractmethod
+    def get_by_seller_with_total(self, seller_id: int, skip: int = 0, limit: int = 100) -> Tuple[List[Dict[str, Any]], int]:
+        """Get a page of a seller's product rows together with their total count."""
+        pass
+    
     @abstractmethod
     def create(self, product_data: ProductCreate, seller_id: int) -> Product:
         """Create a new product."""
@@ -146,8 +186,8 @@ class ProductRepositoryInterface(ABC):
         pass
     
     @abstractmethod
-    def soft_delete(self, product_id: int) -> bool:
-        """Soft delete a product."""
+    def soft_delete(self, product_id: int, seller_id: Optional[int] = None) -> bool:
+        """Soft delete a live product, optionally only if it belongs to the seller."""
         pass
 
     @abstractmethod
@@ -200,6 +240,11 @@ class ProductRepositoryInterface(ABC):
         """Get products by category name."""
         pass
     
+    @abstractmethod
+    def get_by_category_with_total(self, category: str, skip: int = 0, limit: int = 100) -> Tuple[List[Dict[str, Any]], int]:
+        """Get a page of product rows in a category together with their total count."""
+        pass
+    
     @abstractmethod
     def archive_sold_product(self, product_id: int, buyer_id: int | None, sale_price: float) -> bool:
         """Archive product as sold using stored procedure."""
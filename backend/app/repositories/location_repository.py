@@ -1,12 +1,16 @@
 """Location Repository implementation."""
 from typing import List, Optional
 
+from sqlalchemy import exists, func
+from sqlalchemy.dialects.mysql import insert
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 
 from app.repositories.base import LocationRepositoryInterface
 from app.models.location import Location
+from app.models.product import Product
+from app.models.user import User
 
 
 class LocationRepository(LocationRepositoryInterface):
@@ -17,7 +21,7 @@ class LocationRepository(LocationRepositoryInterface):
     
     def get_by_id(self, location_id: int) -> Optional[Location]:
         """Get location by ID."""
-        return self.db.query(Location).filter(Location.id == location_id).first()
+        return self.db.get(Location, location_id)
     
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Location]:
         """Get all locations with pagination."""
@@ -55,8 +59,14 @@ class LocationRepository(LocationRepositoryInterface):
         if existing_location:
             return existing_location
         
-        # If not found, create new location
-        return self.create(city, postcode)
+        # If not found, upsert on uq_locations_city_postcode so a concurrent
+        # insert of the same pair resolves to its id instead of failing.
+        # LAST_INSERT_ID(id) makes lastrowid report the existing row's id.
+        stmt = insert(Location).values(city=city, postcode=postcode)
+        stmt = stmt.on_duplicate_key_update(id=func.last_insert_id(Location.id))
+        location_id = self.db.execute(stmt).lastrowid
+        self.db.commit()
+        return self.db.get(Location, location_id)
     
     def search_by_city(self, city: str, limit: int = 10) -> List[Location]:
         """Search locations by city name."""
@@ -77,7 +87,7 @@ class LocationRepository(LocationRepositoryInterface):
     
     def update(self, location_id: int, city: Optional[str] = None, postcode: Optional[str] = None) -> Optional[Location]:
         """Update location information."""
-        location = self.db.query(Location).filter(Location.id == location_id).first()
+        location = self.db.get(Location, location_id)
         if not location:
             return None
         
@@ -99,18 +109,19 @@ class LocationRepository(LocationRepositoryInterface):
     
     def delete(self, location_id: int) -> bool:
         """Delete a location."""
-        location = self.db.query(Location).filter(Location.id == location_id).first()
+        location = self.db.get(Location, location_id)
         if not location:
             return False
         
-        # Check if location is being used by users or products
-        if hasattr(location, 'users') and location.users:
+        # Check if location is being used by users or products; EXISTS stops at
+        # the first referencing row instead of loading every one of them
+        if self.db.query(exists().where(User.location_id == location_id)).scalar():
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot delete location that is in use by users"
             )
         
-        if hasattr(location, 'products') and location.products:
+        if self.db.query(exists().where(Product.location_id == location_id)).scalar():
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot delete location that is in use by products"
@@ -2,12 +2,30 @@
 from datetime import datetime, timezone
 from typing import List, Optional
 
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import desc, exists, and_
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
+from sqlalchemy import desc, exists, and_, func, insert, select, bindparam
 
 from app.models.messages import Conversation, ConversationParticipant, Message, MessageRead
 
 
+# Built once so every participant check reuses the same cached compiled statement
+IS_PARTICIPANT_STMT = select(
+    exists().where(
+        ConversationParticipant.conversation_id == bindparam("conversation_id"),
+        ConversationParticipant.user_id == bindparam("user_id")
+    )
+)
+
+# Participants and messages are loaded by separate IN queries; joining both
+# collections would return one row per participant and message pair. Responses
+# read only participant usernames and message columns, so anything else raises
+CONVERSATION_LOAD_OPTIONS = [
+    selectinload(Conversation.participants).joinedload(ConversationParticipant.user),
+    selectinload(Conversation.messages).raiseload('*'),
+    raiseload('*'),
+]
+
+
 class MessageRepository:
     """Message repository operations."""
     
@@ -20,10 +38,7 @@ class MessageRepository:
         """Get conversation by ID with participants and messages loaded."""
         return (
             self.db.query(Conversation)
-            .options(
-                joinedload(Conversation.participants).joinedload(ConversationParticipant.user),
-                joinedload(Conversation.messages).joinedload(Message.sender)
-            )
+            .options(*CONVERSATION_LOAD_OPTIONS)
             .filter(Conversation.id == conversation_id)
             .first()
         )
@@ -39,10 +54,7 @@ class MessageRepository:
             self.db.query(Conversation)
             .join(ConversationParticipant, ConversationParticipant.conversation_id == Conversation.id)
             .filter(ConversationParticipant.user_id == user_id)
-            .options(
-                joinedload(Conversation.participants).joinedload(ConversationParticipant.user),
-                joinedload(Conversation.messages).joinedload(Message.sender)
-            )
+            .options(*CONVERSATION_LOAD_OPTIONS)
             .order_by(desc(Conversation.updated_at))
             .offset(skip)
             .limit(limit)
@@ -51,44 +63,31 @@ class MessageRepository:
     
     def create_conversation(self, product_id: int) -> Conversation:
         """Create a new conversation for a product."""
-        now = datetime.now(timezone.utc)
-        conversation = Conversation(
-            product_id=product_id,
-            created_at=now,
-            updated_at=now
-        )
+        conversation = Conversation(product_id=product_id)
         self.db.add(conversation)
         self.db.flush()  # Get the conversation ID
         return conversation
     
     def update_conversation_timestamp(self, conversation_id: int) -> None:
         """Update the conversation's updated_at timestamp."""
-        conversation = self.db.query(Conversation).filter(
+        self.db.query(Conversation).filter(
             Conversation.id == conversation_id
-        ).first()
-        if conversation:
-            conversation.updated_at = datetime.now(timezone.utc)
-            self.db.flush()
+        ).update({Conversation.updated_at: func.utc_timestamp()}, synchronize_session=False)
     
     # ===== Participant Operations =====
     
     def is_participant(self, conversation_id: int, user_id: int) -> bool:
         """Check if a user is a participant in a conversation."""
-        return self.db.query(
-            exists().where(
-                and_(
-                    ConversationParticipant.conversation_id == conversation_id,
-                    ConversationParticipant.user_id == user_id
-                )
-            )
-        ).scalar()
+        return bool(self.db.execute(
+            IS_PARTICIPANT_STMT,
+            {"conversation_id": conversation_id, "user_id": user_id}
+        ).scalar())
     
     def add_participant(self, conversation_id: int, user_id: int) -> ConversationParticipant:
         """Add a participant to a conversation."""
         participant = ConversationParticipant(
             conversation_id=conversation_id,
-            user_id=user_id,
-            joined_at=datetime.now(timezone.utc)
+            user_id=user_id
         )
         self.db.add(participant)
         self.db.flush()
@@ -141,6 +140,9 @@ class MessageRepository:
         body: str
     ) -> Message:
         """Create a new message."""
+        # created_at is set here rather than by the column's SQL default: without
+        # RETURNING a server-side value is expired at flush, and callers hand the
+        # message back after detaching it
         message = Message(
             conversation_id=conversation_id,
             sender_id=sender_id,
@@ -152,23 +154,31 @@ class MessageRepository:
         self.update_conversation_timestamp(conversation_id)
         return message
     
-    def update_message(self, message_id: int, new_body: str) -> Optional[Message]:
-        """Update a message's body."""
-        message = self.db.query(Message).filter(Message.id == message_id).first()
-        if message and not message.deleted_at:
-            message.body = new_body
-            self.db.flush()
-            return message
-        return None
-    
-    def soft_delete_message(self, message_id: int) -> bool:
-        """Soft delete a message."""
-        message = self.db.query(Message).filter(Message.id == message_id).first()
-        if message and not message.deleted_at:
-            message.deleted_at = datetime.now(timezone.utc)
-            self.db.flush()
-            return True
-        return False
+    def update_message(self, message_id: int, sender_id: int, new_body: str) -> bool:
+        """Update a message's body if it is live and owned by the sender."""
+        updated = (
+            self.db.query(Message)
+            .filter(
+                Message.id == message_id,
+                Message.sender_id == sender_id,
+                Message.deleted_at.is_(None)
+            )
+            .update({Message.body: new_body}, synchronize_session=False)
+        )
+        return updated > 0
+    
+    def soft_delete_message(self, message_id: int, sender_id: int) -> bool:
+        """Soft delete a message if it is live and owned by the sender."""
+        deleted = (
+            self.db.query(Message)
+            .filter(
+                Message.id == message_id,
+                Message.sender_id == sender_id,
+                Message.deleted_at.is_(None)
+            )
+            .update({Message.deleted_at: func.utc_timestamp()}, synchronize_session=False)
+        )
+        return deleted > 0
     
     # ===== Message Read Tracking =====
     
@@ -220,8 +230,7 @@ class MessageRepository:
         """Mark a specific message as read for a user."""
         message_read = MessageRead(
             message_id=message_id,
-            user_id=user_id,
-            read_at=datetime.now(timezone.utc)
+            user_id=user_id
         )
         self.db.add(message_read)
         self.db.flush()
@@ -229,21 +238,20 @@ class MessageRepository:
     
     def mark_messages_as_read(self, message_ids: List[int], user_id: int) -> None:
         """Mark multiple messages as read for a user."""
-        for message_id in message_ids:
-            # Check if already marked as read
-            exists_read = self.db.query(MessageRead).filter(
-                MessageRead.message_id == message_id,
-                MessageRead.user_id == user_id
-            ).first()
-            
-            if not exists_read:
-                message_read = MessageRead(
-                    message_id=message_id,
-                    user_id=user_id,
-                    read_at=datetime.now(timezone.utc)
-                )
-                self.db.add(message_read)
-        self.db.flush()
+        # One lookup for the already-read ids and one multi-row INSERT for the rest
+        already_read = {
+            message_id for (message_id,) in self.db.query(MessageRead.message_id).filter(
+                MessageRead.user_id == user_id,
+                MessageRead.message_id.in_(message_ids)
+            )
+        }
+        rows = [
+            {"message_id": message_id, "user_id": user_id}
+            for message_id in dict.fromkeys(message_ids)
+            if message_id not in already_read
+        ]
+        if rows:
+            self.db.execute(insert(MessageRead), rows)
     
     def commit(self) -> None:
         """Commit the current transaction."""
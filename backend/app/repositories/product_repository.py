@@ -1,13 +1,15 @@
 """Product Repository implementation."""
-from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any
+import re
+from operator import attrgetter
+from typing import List, Optional, Dict, Any, Tuple
 
-from sqlalchemy.orm import Session, joinedload, selectinload
-from sqlalchemy import and_, desc, asc, or_, func, text
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
+from sqlalchemy import and_, desc, asc, or_, func, text, insert, literal, select, union_all
+from sqlalchemy.dialects.mysql import match
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 
-from app.repositories.base import ProductRepositoryInterface
+from app.repositories.base import ProductAuthFields, ProductRepositoryInterface
 from app.models.product import Product
 from app.models.category import Category
 from app.models.price_history import ProductPriceHistory
@@ -15,17 +17,31 @@ from app.models.product_details import Color, Material, Tag
 from app.models.product_details import ProductColor, ProductMaterial, ProductTag
 from app.models.product_images import ProductImage
 from app.models.item_views import ItemView
-from app.models.favorites import Favorite
+from app.models.location import Location
+from app.models.user import User
 from app.schemas.product_schema import ProductCreate, ProductUpdate, ProductFilter
 
 
 # Common loading options for different query types
+# Everything ProductResponse reads is loaded up front; raiseload('*') turns any
+# other relationship access on a listed product into an error instead of a
+# silent query per row. Seller and location are many-to-one and mostly shared
+# across a page (a profile page is a single seller), so they are fetched once
+# per distinct id rather than joined onto every product row
 PRODUCT_LIST_LOAD_OPTIONS = [
-    joinedload(Product.seller),
-    joinedload(Product.location),
-    selectinload(Product.images)
+    selectinload(Product.seller),
+    selectinload(Product.location),
+    selectinload(Product.images),
+    selectinload(Product.colors),
+    selectinload(Product.materials),
+    selectinload(Product.tags),
+    selectinload(Product.price_changes),
+    raiseload('*'),
 ]
 
+# views_count and likes_count are trigger-maintained columns, so the views and
+# favorites collections are never loaded just to be counted; as with listings,
+# anything else the detail response touches must be added here explicitly
 PRODUCT_DETAIL_LOAD_OPTIONS = [
     joinedload(Product.seller),
     joinedload(Product.location),
@@ -33,11 +49,86 @@ PRODUCT_DETAIL_LOAD_OPTIONS = [
     selectinload(Product.colors),
     selectinload(Product.materials),
     selectinload(Product.tags),
-    selectinload(Product.favorites),
-    selectinload(Product.views),
     selectinload(Product.price_changes),
+    raiseload('*'),
 ]
 
+# Scalar columns of a product listing row; matches the flat fields of ProductResponse
+PRODUCT_LIST_COLUMNS = (
+    Product.id, Product.title, Product.description, Product.price_amount,
+    Product.price_currency, Product.category_id, Product.condition, Product.quantity,
+    Product.likes_count, Product.views_count, Product.status, Product.seller_id,
+    Product.location_id, Product.sold_at, Product.created_at, Product.updated_at,
+    Product.width_cm, Product.height_cm, Product.depth_cm, Product.weight_kg,
+)
+# Listing rows start with PRODUCT_LIST_COLUMNS, so their values pair up with these keys
+PRODUCT_LIST_KEYS = tuple(column.key for column in PRODUCT_LIST_COLUMNS)
+# Prebuilt (ascending, descending) orderings for each column an explicit
+# sort_field may name, and the named sort_by options
+PRODUCT_SORT_COLUMNS = {column.key: (column.asc(), column.desc()) for column in PRODUCT_LIST_COLUMNS}
+PRODUCT_SORT_OPTIONS = {
+    "newest": desc(Product.created_at),
+    "oldest": asc(Product.created_at),
+    "price_low": asc(Product.price_amount),
+    "price_high": desc(Product.price_amount),
+    "title": asc(Product.title),
+}
+DEFAULT_PRODUCT_SORT = PRODUCT_SORT_OPTIONS["newest"]
+# Listing rows with seller, location and a window total; built once and narrowed per request
+PRODUCT_LIST_ROWS = (
+    select(
+        *PRODUCT_LIST_COLUMNS,
+        User.username.label("seller_username"),
+        User.email.label("seller_email"),
+        Location.city.label("location_city"),
+        Location.postcode.label("location_postcode"),
+        func.count().over().label("total_count"),
+    )
+    .outerjoin(User, User.id == Product.seller_id)
+    .outerjoin(Location, Location.id == Product.location_id)
+)
+_row_seller = attrgetter("seller_id", "seller_username", "seller_email")
+_row_location = attrgetter("location_id", "location_city", "location_postcode")
+
+# Many-to-many detail links: (id list field, association model, its detail FK,
+# detail model, response collection key)
+PRODUCT_DETAIL_LINKS = (
+    ("color_ids", ProductColor, "color_id", Color, "colors"),
+    ("material_ids", ProductMaterial, "material_id", Material, "materials"),
+    ("tag_ids", ProductTag, "tag_id", Tag, "tags"),
+)
+
+
+def _product_text_match(against: str):
+    """MATCH ... AGAINST on the ft_product_search FULLTEXT index (title, description)."""
+    return match(Product.title, Product.description, against=against)
+
+
+def _in_category_named(name: str):
+    """Match products by category name through the name index, without joining categories."""
+    return Product.category_id.in_(select(Category.id).where(Category.name == name))
+
+
+# InnoDB FULLTEXT defaults (innodb_ft_min_token_size and the built-in stopword
+# list). Words below the size or on the list are never indexed, and a required
+# "+word*" term for one matches nothing, so they are left out of the search.
+FULLTEXT_MIN_TOKEN_SIZE = 3
+FULLTEXT_STOPWORDS = frozenset({
+    "a", "about", "an", "are", "as", "at", "be", "by", "com", "de", "en",
+    "for", "from", "how", "i", "in", "is", "it", "la", "of", "on", "or",
+    "that", "the", "this", "to", "was", "what", "when", "where", "who",
+    "will", "with", "und", "www",
+})
+
+
+def _prefix_search_terms(query: str) -> str:
+    """Boolean-mode query requiring every indexable word of the input as a word prefix."""
+    return " ".join(
+        f"+{word}*"
+        for word in re.findall(r"\w+(?:'\w+)*", query)
+        if len(word) >= FULLTEXT_MIN_TOKEN_SIZE and word.lower() not in FULLTEXT_STOPWORDS
+    )
+
 
 class ProductRepository(ProductRepositoryInterface):
     """Product repository operations."""
@@ -54,6 +145,14 @@ class ProductRepository(ProductRepositoryInterface):
             Product.deleted_at.is_(None)
         ).first()
     
+    def get_auth_fields(self, product_id: int) -> Optional[ProductAuthFields]:
+        """Get seller, price and status of a product without loading the entity."""
+        row = self.db.query(Product.seller_id, Product.price_amount, Product.status).filter(
+            Product.id == product_id,
+            Product.deleted_at.is_(None)
+        ).first()
+        return ProductAuthFields(*row) if row else None
+    
     def get_all_filtered(
         self, 
         filters: Optional[ProductFilter] = None,
@@ -66,30 +165,40 @@ class ProductRepository(ProductRepositoryInterface):
         """Get filtered products with pagination and sorting."""
         load_options = PRODUCT_DETAIL_LOAD_OPTIONS if load_details else PRODUCT_LIST_LOAD_OPTIONS
         query = self.db.query(Product).options(*load_options).filter(Product.deleted_at.is_(None))
-        
-        # Apply filters
-        if filters:
-            query = self._apply_filters(query, filters)
-        
-        # Apply sorting
-        if sort_field:
-            if sort_direction == 'asc':
-                query = query.order_by(getattr(Product, sort_field).asc())
-            else:
-                query = query.order_by(getattr(Product, sort_field).desc())
-        else:
-            query = self._apply_sorting(query, filters)
+        query = self._apply_filters_and_sorting(query, filters, sort_field, sort_direction)
         
         products = query.offset(skip).limit(limit).all()
         
         return products
     
+    def get_page_with_total(
+        self,
+        filters: Optional[ProductFilter] = None,
+        skip: int = 0,
+        limit: int = 100,
+        sort_field: Optional[str] = None,
+        sort_direction: str = 'desc'
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Get a page of filtered product rows and the total match count in one query."""
+        query = PRODUCT_LIST_ROWS.filter(Product.deleted_at.is_(None))
+        query = self._apply_filters_and_sorting(query, filters, sort_field, sort_direction)
+        
+        return self._fetch_page_with_total(query, skip, limit, lambda: self.count_filtered(filters))
+    
     def get_by_seller(self, seller_id: int, skip: int = 0, limit: int = 100) -> List[Product]:
         """Get products by seller ID."""
         return self.db.query(Product).options(*PRODUCT_LIST_LOAD_OPTIONS).filter(
             Product.seller_id == seller_id,
             Product.deleted_at.is_(None)
-        ).order_by(desc(Product.created_at)).offset(skip).limit(limit).all()
+        ).order_by(DEFAULT_PRODUCT_SORT).offset(skip).limit(limit).all()
+    
+    def get_by_seller_with_total(self, seller_id: int, skip: int = 0, limit: int = 100) -> Tuple[List[Dict[str, Any]], int]:
+        """Get a page of a seller's product rows and their total count in one query."""
+        query = PRODUCT_LIST_ROWS.filter(
+            Product.seller_id == seller_id,
+            Product.deleted_at.is_(None)
+        ).order_by(DEFAULT_PRODUCT_SORT)
+        return self._fetch_page_with_total(query, skip, limit, lambda: self.count_by_seller(seller_id))
     
     def create(self, product_data: ProductCreate, seller_id: int) -> Product:
         """Create a new product."""
@@ -109,14 +218,12 @@ class ProductRepository(ProductRepositoryInterface):
                 height_cm=product_data.height_cm,
                 depth_cm=product_data.depth_cm,
                 weight_kg=product_data.weight_kg,
-                seller_id=seller_id,
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc)
+                seller_id=seller_id
             )
             
+            # Flush for the id only; the product and everything below commit together
             self.db.add(db_product)
-            self.db.commit()
-            self.db.refresh(db_product)
+            self.db.flush()
             
             # Create initial price history entry
             if product_data.price_amount is not None:
@@ -132,17 +239,10 @@ class ProductRepository(ProductRepositoryInterface):
             
             # Handle images
             if hasattr(product_data, 'image_urls') and product_data.image_urls:
-                for i, image_url in enumerate(product_data.image_urls):
-                    image = ProductImage(
-                        product_id=db_product.id,
-                        url=image_url,
-                        sort_order=i
-                    )
-                    self.db.add(image)
+                self._insert_images(db_product.id, product_data.image_urls)
             
             self.db.commit()
-            self.db.refresh(db_product)
-            return db_product
+            return self._reload_for_response(db_product.id)
             
         except IntegrityError as e:
             self.db.rollback()
@@ -183,54 +283,40 @@ class ProductRepository(ProductRepositoryInterface):
         keep_image_ids = update_data.pop('keep_image_ids', None)
         update_data.pop('image_urls', None)  # Remove old field if present
         
+        current_images = list(product.images)
         if keep_image_ids is not None:
-            # Get current images
-            current_images = self.db.query(ProductImage).filter(
-                ProductImage.product_id == product_id
-            ).all()
-            
             # Identify images to delete (not in keep list)
-            for img in current_images:
-                if img.id not in keep_image_ids:
-                    deleted_image_urls.append(img.url)
-                    self.db.delete(img)
-        
-        # Add new images
+            removed_images = [img for img in current_images if img.id not in keep_image_ids]
+            if removed_images:
+                deleted_image_urls = [img.url for img in removed_images]
+                self.db.query(ProductImage).filter(
+                    ProductImage.id.in_([img.id for img in removed_images])
+                ).delete(synchronize_session=False)
+                current_images = [img for img in current_images if img.id in keep_image_ids]
+        
+        # Add new images after the ones that remain
         if new_image_urls:
-            # Get current max sort_order
-            max_sort_order = 0
-            remaining_images = self.db.query(ProductImage).filter(
-                ProductImage.product_id == product_id
-            ).all()
-            
-            if remaining_images:
-                max_sort_order = max(img.sort_order for img in remaining_images)
-            
-            for i, image_url in enumerate(new_image_urls):
-                new_image = ProductImage(
-                    product_id=product_id,
-                    url=image_url,
-                    sort_order=max_sort_order + i + 1
-                )
-                self.db.add(new_image)
+            max_sort_order = max((img.sort_order for img in current_images), default=0)
+            self._insert_images(product_id, new_image_urls, start=max_sort_order + 1)
+        
+        self.db.expire(product, ["images"])
         
         # Handle status changes
         if 'status' in update_data:
             new_status = update_data['status']
             if new_status == 'sold':
-                product.sold_at = datetime.now(timezone.utc)
+                product.sold_at = func.utc_timestamp()
         
         # Update regular fields
         for field, value in update_data.items():
             if not field.endswith('_ids'):  # Skip relationship fields
                 setattr(product, field, value)
         
-        product.updated_at = datetime.now(timezone.utc)
+        product.updated_at = func.utc_timestamp()
         
         try:
             self.db.commit()
-            self.db.refresh(product)
-            return product, deleted_image_urls
+            return self._reload_for_response(product_id), deleted_image_urls
         except IntegrityError as e:
             self.db.rollback()
             raise HTTPException(
@@ -240,41 +326,44 @@ class ProductRepository(ProductRepositoryInterface):
     
     def delete(self, product_id: int) -> Optional[List[str]]:
         """Hard delete a product and all related data."""
-        product = self.db.query(Product).options(selectinload(Product.images)).filter(
-            Product.id == product_id
-        ).first()
-        
-        if not product:
-            return None
-        
         # Collect image URLs for cleanup
-        image_urls = [img.url for img in product.images]
+        image_urls = [
+            url for (url,) in self.db.query(ProductImage.url).filter(
+                ProductImage.product_id == product_id
+            ).order_by(ProductImage.sort_order)
+        ]
         
         try:
-            # Delete many-to-many relationships first
-            self.db.query(ProductColor).filter(ProductColor.product_id == product_id).delete()
-            self.db.query(ProductMaterial).filter(ProductMaterial.product_id == product_id).delete() 
-            self.db.query(ProductTag).filter(ProductTag.product_id == product_id).delete()
-            self.db.query(Favorite).filter(Favorite.product_id == product_id).delete()
-            self.db.delete(product)
+            # Images, price history, detail links, favorites and views are removed
+            # by their ON DELETE CASCADE foreign keys
+            deleted = self.db.query(Product).filter(
+                Product.id == product_id
+            ).delete(synchronize_session=False)
+            if not deleted:
+                self.db.rollback()
+                return None
             self.db.commit()
             return image_urls
         except Exception:
             self.db.rollback()
             return None
 
-    def soft_delete(self, product_id: int) -> bool:
-        """Soft delete a product."""
-        product = self.db.query(Product).filter(Product.id == product_id).first()
-        if not product:
-            return False
-        
-        product.deleted_at = datetime.now(timezone.utc)
-        product.updated_at = datetime.now(timezone.utc)
+    def soft_delete(self, product_id: int, seller_id: Optional[int] = None) -> bool:
+        """Soft delete a live product, optionally only if it belongs to the seller."""
+        query = self.db.query(Product).filter(
+            Product.id == product_id,
+            Product.deleted_at.is_(None)
+        )
+        if seller_id is not None:
+            query = query.filter(Product.seller_id == seller_id)
         
         try:
+            deleted = query.update(
+                {Product.deleted_at: func.utc_timestamp(), Product.updated_at: func.utc_timestamp()},
+                synchronize_session=False
+            )
             self.db.commit()
-            return True
+            return deleted > 0
         except IntegrityError:
             self.db.rollback()
             return False
@@ -297,34 +386,42 @@ class ProductRepository(ProductRepositoryInterface):
     
     def search_by_title(self, query: str, skip: int = 0, limit: int = 100) -> List[Product]:
         """Search products by title."""
-        search = f"%{query}%"
-        return self.db.query(Product).options(*PRODUCT_LIST_LOAD_OPTIONS).filter(
-            or_(
-                Product.title.ilike(search),
-                Product.description.ilike(search)
-            ),
+        products = self.db.query(Product).options(*PRODUCT_LIST_LOAD_OPTIONS).filter(
             Product.deleted_at.is_(None),
             Product.status == "active"
-        ).order_by(desc(Product.created_at)).offset(skip).limit(limit).all()
+        )
+        if query:
+            terms = _prefix_search_terms(query)
+            if terms:
+                products = products.filter(_product_text_match(terms).in_boolean_mode())
+            else:
+                # Only short words or stopwords, which the index does not hold
+                search = f"%{query}%"
+                products = products.filter(
+                    or_(Product.title.ilike(search), Product.description.ilike(search))
+                )
+        return products.order_by(DEFAULT_PRODUCT_SORT).offset(skip).limit(limit).all()
     
     def get_recent_products(self, limit: int = 10) -> List[Product]:
         """Get most recently created products."""
         return self.db.query(Product).options(*PRODUCT_LIST_LOAD_OPTIONS).filter(
             Product.deleted_at.is_(None),
             Product.status == "active"
-        ).order_by(desc(Product.created_at)).limit(limit).all()
+        ).order_by(DEFAULT_PRODUCT_SORT).limit(limit).all()
     
     def get_product_details_options(self) -> Dict[str, List[Any]]:
         """Get all colors, materials, and tags for filters."""
-        colors = self.db.query(Color).order_by(Color.name).all()
-        materials = self.db.query(Material).order_by(Material.name).all()
-        tags = self.db.query(Tag).order_by(Tag.name).all()
+        options: Dict[str, List[Any]] = {"colors": [], "materials": [], "tags": []}
+        query = union_all(
+            *(
+                select(literal(kind).label("kind"), model.id, model.name)
+                for kind, model in (("colors", Color), ("materials", Material), ("tags", Tag))
+            )
+        ).order_by("name")
         
-        return {
-            "colors": colors,
-            "materials": materials,
-            "tags": tags
-        }
+        for row in self.db.execute(query):
+            options[row.kind].append({"id": row.id, "name": row.name})
+        return options
 
     def get_all_categories(self) -> List:
         """Get all product categories."""
@@ -348,93 +445,162 @@ class ProductRepository(ProductRepositoryInterface):
     
     def record_view(self, product_id: int, viewer_user_id: int) -> bool:
         """Record a product view and increment views counter."""
-        # Check if user already viewed this product
-        existing_view = self.db.query(ItemView).filter(
-            ItemView.product_id == product_id,
-            ItemView.viewer_user_id == viewer_user_id
-        ).first()
-        
-        if existing_view:
-            return False  # Already viewed
-        
-        # Create new view record
-        new_view = ItemView(
-            product_id=product_id,
-            viewer_user_id=viewer_user_id
-        )
-        
+        # INSERT IGNORE against uq_item_views_product_viewer: a repeat view by the
+        # same user inserts nothing and affects no rows
         try:
-            self.db.add(new_view)
+            result = self.db.execute(
+                insert(ItemView).prefix_with("IGNORE", dialect="mysql").values(
+                    product_id=product_id,
+                    viewer_user_id=viewer_user_id
+                )
+            )
             # Note: views_count is auto-incremented by database trigger
             self.db.commit()
-            return True
+            return result.rowcount == 1
         except IntegrityError:
             self.db.rollback()
             return False
     
     def get_by_category(self, category: str, skip: int = 0, limit: int = 100) -> List[Product]:
         """Get products by category name."""
-        return self.db.query(Product).join(Category, Product.category_id == Category.id).filter(
+        return self._filter_by_category(self.db.query(Product), category).options(
+            *PRODUCT_LIST_LOAD_OPTIONS
+        ).order_by(
+            DEFAULT_PRODUCT_SORT
+        ).offset(skip).limit(limit).all()
+    
+    def get_by_category_with_total(self, category: str, skip: int = 0, limit: int = 100) -> Tuple[List[Dict[str, Any]], int]:
+        """Get a page of product rows in a category and their total count in one query."""
+        query = self._filter_by_category(PRODUCT_LIST_ROWS, category).order_by(DEFAULT_PRODUCT_SORT)
+        return self._fetch_page_with_total(
+            query, skip, limit,
+            lambda: self._filter_by_category(self.db.query(Product), category).count()
+        )
+    
+    def _filter_by_category(self, query, category: str):
+        """Restrict a product query to active products whose category name matches."""
+        return query.filter(
             and_(
-                Category.name.ilike(f"%{category}%"),
+                _in_category_named(category),
                 Product.status == "active",
                 Product.deleted_at.is_(None)
             )
-        ).options(*PRODUCT_LIST_LOAD_OPTIONS).order_by(
-            desc(Product.created_at)
-        ).offset(skip).limit(limit).all()
+        )
+    
+    def _reload_for_response(self, product_id: int) -> Product:
+        """Reload a just-committed product with everything ProductResponse reads in one batch."""
+        return self.db.query(Product).options(*PRODUCT_DETAIL_LOAD_OPTIONS).populate_existing().filter(
+            Product.id == product_id
+        ).one()
+    
+    def _fetch_page_with_total(self, query, skip: int, limit: int, count_total) -> Tuple[List[Dict[str, Any]], int]:
+        """Run a listing rows query for one page and attach each row's collections."""
+        rows = self.db.execute(query.offset(skip).limit(limit)).all()
+        
+        if not rows:
+            # Past the last page the window total is unavailable, so count separately
+            return [], count_total() if skip else 0
+        
+        products = []
+        for row in rows:
+            seller_id, username, email = _row_seller(row)
+            location_id, city, postcode = _row_location(row)
+            product = dict(zip(PRODUCT_LIST_KEYS, row))
+            product["seller"] = {
+                "id": seller_id, "username": username, "email": email
+            } if username is not None else None
+            product["location"] = {
+                "id": location_id, "city": city, "postcode": postcode
+            } if city is not None else None
+            products.append(product)
+        
+        self._attach_list_collections(products)
+        return products, rows[0].total_count
+    
+    def _attach_list_collections(self, products: List[Dict[str, Any]]) -> None:
+        """Fill images, colors, materials, tags and price changes with one query each."""
+        by_id = {product["id"]: product for product in products}
+        for product in products:
+            product.update(images=[], colors=[], materials=[], tags=[], price_changes=[])
+        
+        ids = list(by_id)
+        for row in self.db.execute(
+            select(ProductImage.product_id, ProductImage.id, ProductImage.url, ProductImage.sort_order)
+            .where(ProductImage.product_id.in_(ids))
+            .order_by(ProductImage.sort_order)
+        ):
+            by_id[row.product_id]["images"].append(
+                {"id": row.id, "url": row.url, "sort_order": row.sort_order}
+            )
+        
+        for _, link_model, detail_fk, detail_model, key in PRODUCT_DETAIL_LINKS:
+            for row in self.db.execute(
+                select(link_model.product_id, detail_model.id, detail_model.name)
+                .join(detail_model, detail_model.id == getattr(link_model, detail_fk))
+                .where(link_model.product_id.in_(ids))
+            ):
+                by_id[row.product_id][key].append({"id": row.id, "name": row.name})
+        
+        for row in self.db.execute(
+            select(
+                ProductPriceHistory.product_id, ProductPriceHistory.changed_at,
+                ProductPriceHistory.amount, ProductPriceHistory.currency
+            ).where(ProductPriceHistory.product_id.in_(ids))
+        ):
+            by_id[row.product_id]["price_changes"].append(
+                {"changed_at": row.changed_at, "amount": row.amount, "currency": row.currency}
+            )
+    
+    def _apply_filters_and_sorting(
+        self,
+        query,
+        filters: Optional[ProductFilter],
+        sort_field: Optional[str],
+        sort_direction: str
+    ):
+        """Apply filters and either an explicit sort field or the filter's sort option."""
+        if filters:
+            query = self._apply_filters(query, filters)
+        
+        orderings = PRODUCT_SORT_COLUMNS.get(sort_field) if sort_field else None
+        if orderings is not None:
+            ascending, descending = orderings
+            return query.order_by(ascending if sort_direction == 'asc' else descending)
+        return self._apply_sorting(query, filters)
     
     def _apply_filters(self, query, filters: ProductFilter):
         """Apply filters to the query."""
+        # Category names and conditions are compared exactly so the lookups can
+        # use an index; the columns' collation keeps them case-insensitive
+        conditions = []
         if filters.category:
-            query = query.join(Category, Product.category_id == Category.id)
-            query = query.filter(Category.name.ilike(f"%{filters.category}%"))
-        
+            conditions.append(_in_category_named(filters.category))
         if filters.min_price is not None:
-            query = query.filter(Product.price_amount >= filters.min_price)
-        
+            conditions.append(Product.price_amount >= filters.min_price)
         if filters.max_price is not None:
-            query = query.filter(Product.price_amount <= filters.max_price)
-        
+            conditions.append(Product.price_amount <= filters.max_price)
         if filters.location_id is not None:
-            query = query.filter(Product.location_id == filters.location_id)
-        
+            conditions.append(Product.location_id == filters.location_id)
         if filters.condition:
-            query = query.filter(Product.condition.ilike(f"%{filters.condition}%"))
-        
+            conditions.append(Product.condition == filters.condition)
         if filters.status is not None:
-            query = query.filter(Product.status == filters.status)
-        
+            conditions.append(Product.status == filters.status)
         if filters.search_term:
             # Use MySQL FULLTEXT search with MATCH AGAINST
             # ft_product_search index on (title, description)
             # Supports boolean operators: +required -exclude "exact phrase"
-            search_term = filters.search_term.replace("'", "''")  # Escape single quotes
-            query = query.filter(
-                text(f"MATCH(title, description) AGAINST('{search_term}' IN BOOLEAN MODE)")
-            )
+            conditions.append(_product_text_match(filters.search_term).in_boolean_mode())
         
-        return query
+        return query.filter(*conditions) if conditions else query
     
     def _apply_sorting(self, query, filters: Optional[ProductFilter]):
         """Apply sorting to the query."""
-        sort_options = {
-            "newest": desc(Product.created_at),
-            "oldest": asc(Product.created_at),
-            "price_low": asc(Product.price_amount),
-            "price_high": desc(Product.price_amount),
-            "title": asc(Product.title)
-        }
-        
         if filters and filters.search_term and filters.sort_by == "relevance":
-            search_term = filters.search_term.replace("'", "''")  # Escape single quotes
-            return query.order_by(
-                text(f"MATCH(title, description) AGAINST('{search_term}' IN NATURAL LANGUAGE MODE) DESC")
-            )
+            return query.order_by(desc(_product_text_match(filters.search_term)))
         
         if filters and filters.sort_by:
-            return query.order_by(sort_options.get(filters.sort_by, desc(Product.created_at)))
-        return query.order_by(desc(Product.created_at))
+            return query.order_by(PRODUCT_SORT_OPTIONS.get(filters.sort_by, DEFAULT_PRODUCT_SORT))
+        return query.order_by(DEFAULT_PRODUCT_SORT)
     
     def archive_sold_product(self, product_id: int, buyer_id: int | None, sale_price: float) -> bool:
         """Archive product as sold using stored procedure."""
@@ -449,31 +615,44 @@ class ProductRepository(ProductRepositoryInterface):
             self.db.rollback()
             return False
     
+    def _insert_images(self, product_id: int, image_urls: List[str], start: int = 0):
+        """Insert a product's image rows in one statement, numbering them from start."""
+        self.db.execute(
+            insert(ProductImage),
+            [
+                {"product_id": product_id, "url": url, "sort_order": start + i}
+                for i, url in enumerate(image_urls)
+            ],
+        )
+    
     def _handle_product_relationships(self, product: Product, data, is_update: bool = False):
         """Handle many-to-many relationships for colors, materials, and tags."""
-        # Handle colors
-        if hasattr(data, 'color_ids') or (is_update and 'color_ids' in data):
-            color_ids = data.color_ids if hasattr(data, 'color_ids') else data.get('color_ids')
-            if is_update:
-                product.colors.clear()
-            if color_ids:
-                colors = self.db.query(Color).filter(Color.id.in_(color_ids)).all()
-                product.colors.extend(colors)
-        
-        # Handle materials
-        if hasattr(data, 'material_ids') or (is_update and 'material_ids' in data):
-            material_ids = data.material_ids if hasattr(data, 'material_ids') else data.get('material_ids')
-            if is_update:
-                product.materials.clear()
-            if material_ids:
-                materials = self.db.query(Material).filter(Material.id.in_(material_ids)).all()
-                product.materials.extend(materials)
-        
-        # Handle tags
-        if hasattr(data, 'tag_ids') or (is_update and 'tag_ids' in data):
-            tag_ids = data.tag_ids if hasattr(data, 'tag_ids') else data.get('tag_ids')
+        requested = {}
+        for field, *_ in PRODUCT_DETAIL_LINKS:
+            if hasattr(data, field) or (is_update and field in data):
+                ids = getattr(data, field) if hasattr(data, field) else data.get(field)
+                requested[field] = list(dict.fromkeys(ids or []))
+        
+        if not requested:
+            return
+        
+        # Write the association rows directly instead of loading and rebuilding the
+        # relationship collections; INSERT ... SELECT skips unknown ids, as before
+        for field, link_model, detail_fk, detail_model, _ in PRODUCT_DETAIL_LINKS:
+            if field not in requested:
+                continue
             if is_update:
-                product.tags.clear()
-            if tag_ids:
-                tags = self.db.query(Tag).filter(Tag.id.in_(tag_ids)).all()
-                product.tags.extend(tags)
+                self.db.query(link_model).filter(
+                    link_model.product_id == product.id
+                ).delete(synchronize_session=False)
+            if requested[field]:
+                self.db.execute(
+                    insert(link_model).from_select(
+                        ["product_id", detail_fk],
+                        select(literal(product.id), detail_model.id).where(
+                            detail_model.id.in_(requested[field])
+                        ),
+                    )
+                )
+        
+        self.db.expire(product, ["colors", "materials", "tags"])
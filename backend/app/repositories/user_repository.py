@@ -1,20 +1,41 @@
 """User Repository implementation."""
-from datetime import datetime, timezone
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import exists, func, select
+from sqlalchemy.orm import Session, aliased, joinedload, raiseload
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 
 from app.repositories.base import UserRepositoryInterface
 from app.models.user import User
+from app.models.product import Product
 from app.models.favorites import Favorite
 from app.models.item_views import ItemView
-from app.models.messages import Message, ConversationParticipant, Conversation
-from app.models.sold import SoldItemArchive
+from app.models.messages import ConversationParticipant, Conversation
 from app.schemas.user_schema import UserCreate, UserUpdate
 
 
+# Everything user responses read is loaded up front; any other relationship
+# access on a loaded user raises instead of issuing a query per user
+USER_LOAD_OPTIONS = [
+    joinedload(User.location),
+    raiseload('*'),
+]
+
+# Fields of an update payload that can be written straight to users; anything
+# else (such as a plain password) is not a column and is left out
+USER_COLUMNS = frozenset(User.__table__.columns.keys())
+
+# Live products per user, counted inline by the (seller_id, deleted_at, ...) index
+USER_PRODUCT_COUNT = (
+    select(func.count(Product.id))
+    .where(Product.seller_id == User.id, Product.deleted_at.is_(None))
+    .correlate(User)
+    .scalar_subquery()
+    .label("product_count")
+)
+
+
 class UserRepository(UserRepositoryInterface):
     """User repository operations."""
     
@@ -23,15 +44,18 @@ class UserRepository(UserRepositoryInterface):
     
     def get_by_id(self, user_id: int) -> Optional[User]:
         """Get user by ID with location relationship loaded."""
-        return self.db.query(User).options(
-            joinedload(User.location)
-        ).filter(User.id == user_id).first()
+        return self.db.query(User).options(*USER_LOAD_OPTIONS).filter(User.id == user_id).first()
+    
+    def get_with_product_count(self, user_id: int) -> Optional[Tuple[User, int]]:
+        """Get user by ID with location loaded, together with their live product count."""
+        row = self.db.query(User, USER_PRODUCT_COUNT).options(*USER_LOAD_OPTIONS).filter(
+            User.id == user_id
+        ).first()
+        return tuple(row) if row else None
     
     def get_by_username(self, username: str) -> Optional[User]:
         """Get user by username with location relationship loaded."""
-        return self.db.query(User).options(
-            joinedload(User.location)
-        ).filter(User.username == username).first()
+        return self.db.query(User).options(*USER_LOAD_OPTIONS).filter(User.username == username).first()
     
     def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email."""
@@ -44,9 +68,7 @@ class UserRepository(UserRepositoryInterface):
                 username=user_data.username,
                 email=user_data.email,
                 full_name=user_data.full_name,
-                hashed_password=hashed_password,
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc)
+                hashed_password=hashed_password
             )
             
             self.db.add(db_user)
@@ -63,21 +85,22 @@ class UserRepository(UserRepositoryInterface):
     
     def update(self, user_id: int, user_data: UserUpdate) -> Optional[User]:
         """Update user information."""
-        user = self.db.query(User).filter(User.id == user_id).first()
-        if not user:
-            return None
-        
-        # Update only provided fields
-        update_data = user_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(user, field, value)
-        
-        user.updated_at = datetime.now(timezone.utc)
+        # Update only provided fields that are user columns, in one UPDATE
+        update_data = {
+            field: value for field, value in user_data.model_dump(exclude_unset=True).items()
+            if field in USER_COLUMNS
+        }
         
         try:
+            updated = self.db.query(User).filter(User.id == user_id).update(
+                update_data, synchronize_session=False
+            )
+            if not updated:
+                self.db.rollback()
+                return None
             self.db.commit()
-            self.db.refresh(user)
-            return user
+            # The commit expired any loaded copy, so this reloads the updated row
+            return self.db.get(User, user_id)
         except IntegrityError as e:
             self.db.rollback()
             raise HTTPException(
@@ -113,12 +136,7 @@ class UserRepository(UserRepositoryInterface):
         if not search_term:
             return self.get_all(skip, limit, sort_field=sort_field, sort_direction=sort_direction)
         
-        search_filter = f"%{search_term}%"
-        query = self.db.query(User).filter(
-            (User.username.ilike(search_filter)) |
-            (User.email.ilike(search_filter)) |
-            (User.full_name.ilike(search_filter))
-        )
+        query = self.db.query(User).filter(self._search_filter(search_term))
         
         if sort_field:
             if sort_direction == 'asc':
@@ -136,15 +154,37 @@ class UserRepository(UserRepositoryInterface):
             query = query.filter(User.is_active == is_active)
         
         if search_term:
-            search_filter = f"%{search_term}%"
-            query = query.filter(
-                (User.username.ilike(search_filter)) |
-                (User.email.ilike(search_filter)) |
-                (User.full_name.ilike(search_filter))
-            )
+            query = query.filter(self._search_filter(search_term))
         
         return query.count()
     
+    def get_page_with_total(self, skip: int = 0, limit: int = 100, search_term: Optional[str] = None, sort_field: Optional[str] = None, sort_direction: str = 'asc') -> Tuple[List[User], int]:
+        """Get a page of users, optionally searched, together with the total match count."""
+        query = self.db.query(User, func.count().over().label("total_count")).options(*USER_LOAD_OPTIONS)
+        
+        if search_term:
+            query = query.filter(self._search_filter(search_term))
+        
+        if sort_field:
+            if sort_direction == 'asc':
+                query = query.order_by(getattr(User, sort_field).asc())
+            else:
+                query = query.order_by(getattr(User, sort_field).desc())
+        
+        rows = query.offset(skip).limit(limit).all()
+        if not rows:
+            # Past the last page the window total is unavailable, so count separately
+            return [], self.count_filtered(search_term=search_term) if skip else 0
+        return [row.User for row in rows], rows[0].total_count
+    
+    def _search_filter(self, search_term: str):
+        search_filter = f"%{search_term}%"
+        return (
+            (User.username.ilike(search_filter)) |
+            (User.email.ilike(search_filter)) |
+            (User.full_name.ilike(search_filter))
+        )
+    
     def count_total_users(self) -> int:
         """Get total count of users"""
         return self.count_filtered()
@@ -155,18 +195,15 @@ class UserRepository(UserRepositoryInterface):
     
     def get_admin_users(self) -> List[User]:
         """Get all admin users."""
-        return self.db.query(User).options(
-            joinedload(User.location)
-        ).filter(User.is_admin.is_(True)).all()
+        return self.db.query(User).options(*USER_LOAD_OPTIONS).filter(User.is_admin.is_(True)).all()
     
     def toggle_user_status(self, user_id: int) -> Optional[User]:
         """Toggle user active status."""
-        user = self.db.query(User).filter(User.id == user_id).first()
+        user = self.db.get(User, user_id)
         if not user:
             return None
         
         user.is_active = not user.is_active
-        user.updated_at = datetime.now(timezone.utc)
         
         try:
             self.db.commit()
@@ -181,44 +218,34 @@ class UserRepository(UserRepositoryInterface):
 
     def delete(self, user_id: int) -> bool:
         """Delete a user and all related data"""
-        
-        user = self.db.query(User).filter(User.id == user_id).first()
-        if not user:
-            return False
-        
         try:
-            # Get conversation IDs where user is a participant (for cleanup)
-            user_conversation_ids = [
-                cp.conversation_id for cp in 
-                self.db.query(ConversationParticipant.conversation_id)
-                .filter(ConversationParticipant.user_id == user_id).all()
-            ]
-            
-            # Delete messages sent by user
-            self.db.query(Message).filter(Message.sender_id == user_id).delete()
-            
-            # Remove user from conversations
-            self.db.query(ConversationParticipant).filter(ConversationParticipant.user_id == user_id).delete()
-            
-            # Clean up empty conversations
-            for conv_id in user_conversation_ids:
-                remaining_count = self.db.query(ConversationParticipant).filter(
-                    ConversationParticipant.conversation_id == conv_id
-                ).count()
-                if remaining_count == 0:
-                    self.db.query(Conversation).filter(Conversation.id == conv_id).delete()
+            # Conversations the user is the last participant of; their messages
+            # and read receipts go by ON DELETE CASCADE
+            other_participant = aliased(ConversationParticipant)
+            self.db.query(Conversation).filter(
+                Conversation.id.in_(
+                    select(ConversationParticipant.conversation_id).where(ConversationParticipant.user_id == user_id)
+                ),
+                ~exists().where(
+                    other_participant.conversation_id == Conversation.id,
+                    other_participant.user_id != user_id
+                )
+            ).delete(synchronize_session=False)
             
-            # Delete user's favorites and item views (some may be cascade deleted)
-            self.db.query(Favorite).filter(Favorite.user_id == user_id).delete()
-            self.db.query(ItemView).filter(ItemView.viewer_user_id == user_id).delete()
+            # Deleted explicitly rather than by cascade so the counter triggers fire
+            self.db.query(Favorite).filter(Favorite.user_id == user_id).delete(synchronize_session=False)
+            self.db.query(ItemView).filter(ItemView.viewer_user_id == user_id).delete(synchronize_session=False)
             
-            # Update sold items to remove buyer reference (preserve sales history)
-            self.db.query(SoldItemArchive).filter(SoldItemArchive.buyer_id == user_id).update({
-                SoldItemArchive.buyer_id: None
-            })
+            # Deleted explicitly so the product audit trigger fires; their
+            # dependent rows go by ON DELETE CASCADE
+            self.db.query(Product).filter(Product.seller_id == user_id).delete(synchronize_session=False)
             
-            # Delete the user
-            self.db.delete(user)
+            # Sent messages, conversation participation and read receipts cascade
+            # with the user, and archived sales keep their history with a NULL buyer
+            deleted = self.db.query(User).filter(User.id == user_id).delete(synchronize_session=False)
+            if not deleted:
+                self.db.rollback()
+                return False
             self.db.commit()
             return True
         except Exception:
@@ -0,0 +1,8 @@
+"""Response helpers for endpoints that already hold validated response models."""
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+
+def json_response(model: BaseModel) -> Response:
+    """Serialize an already validated response model straight to JSON with pydantic-core."""
+    return Response(content=model.model_dump_json(), media_type="application/json")
@@ -27,7 +27,7 @@ router = APIRouter()
 # ============================================
 
 @router.get("/history/views", response_model=ViewHistoryResponse)
-async def get_my_view_history(
+def get_my_view_history(
     limit: int = Query(20, ge=1, le=100, description="Number of items to return"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -51,7 +51,7 @@ async def get_my_view_history(
 # ============================================
 
 @router.get("/admin/recent-activity", response_model=RecentActivityFeed)
-async def get_recent_activity_feed(
+def get_recent_activity_feed(
     limit: int = Query(5, ge=1, le=20, description="Number of items per category"),
     _admin_user: User = Depends(get_admin_user),
     db: Session = Depends(get_db)
@@ -74,7 +74,7 @@ async def get_recent_activity_feed(
 # ============================================
 
 @router.get("/popular-products", response_model=PopularProductsResponse)
-async def get_popular_products(
+def get_popular_products(
     limit: int = Query(10, ge=1, le=50, description="Number of products to return"),
     db: Session = Depends(get_db)
 ):
@@ -94,7 +94,7 @@ async def get_popular_products(
 # ============================================
 
 @router.get("/products/{product_id}/recommendations", response_model=ProductRecommendationsResponse)
-async def get_product_recommendations(
+def get_product_recommendations(
     product_id: int,
     limit: int = Query(5, ge=1, le=20, description="Number of recommendations to return"),
     db: Session = Depends(get_db)
@@ -16,7 +16,7 @@ router = APIRouter()
 
 # -- Admin user management (CRUD)
 @router.get("/users", response_model=UserListResponse)
-async def get_all_users(
+def get_all_users(
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(15, ge=1, le=100, description="Items per page"),
     search: str = Query(None, description="Search term for username, email, or full name"),
@@ -28,12 +28,9 @@ async def get_all_users(
     """Get all users (admin only)"""
     skip = (page - 1) * size
     
-    if search:
-        users = auth_service.user_repository.search_users(search, skip, size, sort_field, sort_direction)
-        total = auth_service.user_repository.count_filtered(search_term=search)
-    else:
-        users = auth_service.user_repository.get_all(skip, size, sort_field=sort_field, sort_direction=sort_direction)
-        total = auth_service.user_repository.count_filtered()
+    users, total = auth_service.user_repository.get_page_with_total(
+        skip, size, search_term=search, sort_field=sort_field, sort_direction=sort_direction
+    )
     
     # Calculate total pages
     total_pages = ceil(total / size) if total > 0 else 1
@@ -47,7 +44,7 @@ async def get_all_users(
     )
 
 @router.post("/users", response_model=UserResponse, status_code=201)
-async def create_user_admin(
+def create_user_admin(
     user_in: UserCreate,
     _admin_user: User = Depends(get_admin_user),
     auth_service: AuthService = Depends(get_auth_service)
@@ -58,7 +55,7 @@ async def create_user_admin(
 
 
 @router.get("/users/{user_id}", response_model=UserResponse)
-async def get_user_admin(
+def get_user_admin(
     user_id: int,
     _admin_user: User = Depends(get_admin_user),
     auth_service: AuthService = Depends(get_auth_service)
@@ -70,7 +67,7 @@ async def get_user_admin(
 
 
 @router.put("/users/{user_id}", response_model=UserResponse)
-async def update_user_admin(
+def update_user_admin(
     user_id: int,
     user_update: UserUpdate,
     _admin_user: User = Depends(get_admin_user),
@@ -87,7 +84,7 @@ async def update_user_admin(
 
 
 @router.delete("/users/{user_id}")
-async def delete_user_admin(
+def delete_user_admin(
     user_id: int,
     _admin_user: User = Depends(get_admin_user),
     profile_service: ProfileService = Depends(get_profile_service)
@@ -99,7 +96,7 @@ async def delete_user_admin(
 
 # -- Admin product management (CRUD)
 @router.get("/products", response_model=ProductListResponse)
-async def get_all_products_admin(
+def get_all_products_admin(
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(50, ge=1, le=100, description="Items per page"),
     search: str = Query(None, description="Search term for product title or description"),
@@ -137,7 +134,7 @@ async def create_product_admin(
 
 
 @router.get("/products/{product_id}", response_model=ProductResponse)
-async def get_product_admin(
+def get_product_admin(
     product_id: int,
     _admin_user: User = Depends(get_admin_user),
     product_service: ProductService = Depends(get_product_service)
@@ -175,7 +172,7 @@ async def delete_product_admin(
 
 # -- Other Admin routes
 @router.get("/stats")
-async def get_platform_stats(
+def get_platform_stats(
     _admin_user: User = Depends(get_admin_user),
     auth_service: AuthService = Depends(get_auth_service),
     admin_service: AdminService = Depends(get_admin_service)
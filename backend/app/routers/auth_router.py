@@ -19,7 +19,7 @@ LOGIN_RATE_LIMIT = "5/minute" if settings.environment == "production" else "50/m
 
 # Authentication endpoints
 @router.post("/register", response_model=Token, status_code=status.HTTP_201_CREATED)
-async def register_user(user: UserCreate, auth_service: AuthService = Depends(get_auth_service)):
+def register_user(user: UserCreate, auth_service: AuthService = Depends(get_auth_service)):
     """Register a new user and automatically log them in"""
     db_user = auth_service.register_user(user)
     
@@ -39,7 +39,7 @@ async def register_user(user: UserCreate, auth_service: AuthService = Depends(ge
 
 @router.post("/login", response_model=Token)
 @limiter.limit(LOGIN_RATE_LIMIT)
-async def login_user(request: Request, user: UserLogin, auth_service: AuthService = Depends(get_auth_service)):
+def login_user(request: Request, user: UserLogin, auth_service: AuthService = Depends(get_auth_service)):
     """Login user and return JWT token"""
     # Authenticate user
     db_user = auth_service.authenticate_user(user.identifier, user.password)
@@ -8,6 +8,7 @@ from app.dependencies import get_current_user
 from app.models.user import User
 from app.models.favorites import Favorite
 from app.models.product import Product
+from app.repositories.product_repository import PRODUCT_LIST_LOAD_OPTIONS
 from app.schemas.product_schema import ProductResponse
 
 router = APIRouter()
@@ -22,7 +23,7 @@ def add_favorite(
     """Add a product to user's favorites."""
     
     # Check if product exists
-    product = db.query(Product).filter(Product.id == product_id).first()
+    product = db.get(Product, product_id)
     if not product:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -97,7 +98,8 @@ def get_user_favorites(
 ):
     """Get all products in user's favorites."""
     
-    favorites = db.query(Product).join(
+    # Load everything ProductResponse reads up front instead of per favorite
+    favorites = db.query(Product).options(*PRODUCT_LIST_LOAD_OPTIONS).join(
         Favorite, Favorite.product_id == Product.id
     ).filter(
         Favorite.user_id == current_user.id,
@@ -8,7 +8,7 @@ from app.services.location_service import LocationService
 router = APIRouter()
 
 @router.get("/search", response_model=List[LocationResponse])
-async def search_locations(
+def search_locations(
     q: str = Query(..., min_length=1, description="Search query for city or postcode"),
     location_service: LocationService = Depends(get_location_service)
 ):
@@ -17,7 +17,7 @@ async def search_locations(
 
 
 @router.get("/", response_model=List[LocationResponse])
-async def get_all_locations(
+def get_all_locations(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     location_service: LocationService = Depends(get_location_service)
@@ -27,7 +27,7 @@ async def get_all_locations(
 
 
 @router.get("/{location_id}", response_model=LocationResponse)
-async def get_location(
+def get_location(
     location_id: int,
     location_service: LocationService = Depends(get_location_service)
 ):
@@ -42,7 +42,7 @@ async def get_location(
 
 
 @router.post("/", response_model=LocationResponse)
-async def create_location(
+def create_location(
     location: LocationCreate,
     location_service: LocationService = Depends(get_location_service)
 ):
@@ -50,7 +50,7 @@ async def create_location(
     return location_service.create_location(location)
 
 @router.put("/{location_id}", response_model=LocationResponse)
-async def update_location(
+def update_location(
     location_id: int,
     location_update: LocationUpdate,
     location_service: LocationService = Depends(get_location_service)
@@ -60,7 +60,7 @@ async def update_location(
 
 
 @router.delete("/{location_id}")
-async def delete_location(
+def delete_location(
     location_id: int,
     location_service: LocationService = Depends(get_location_service)
 ):
@@ -12,6 +12,7 @@ from app.dependencies import (
     get_location_repository
 )
 from app.models.user import User
+from app.responses import json_response
 from app.schemas.product_schema import (
     ProductCreate,
     ProductFilter,
@@ -29,8 +30,9 @@ from app.schemas.product_schema import ProductDetailsResponse
 
 router = APIRouter()
 
+
 @router.get("/", response_model=ProductListResponse)
-async def get_all_products(
+def get_all_products(
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(15, ge=1, le=100, description="Items per page"),
     category: Optional[str] = Query(None, description="Filter by category"),
@@ -61,16 +63,16 @@ async def get_all_products(
     products, total = product_service.get_products(skip=skip, limit=size, filter_params=filter_params)
     total_pages = ceil(total / size) if total > 0 else 1
 
-    return ProductListResponse(
+    return json_response(ProductListResponse(
         products=[ProductResponse.model_validate(product) for product in products],
         total=total,
         page=page,
         size=size,
         total_pages=total_pages
-    )
+    ))
 
 @router.get("/my-products", response_model=ProductListResponse)
-async def get_my_products(
+def get_my_products(
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(20, ge=1, le=100, description="Items per page"),
     current_user: User = Depends(get_current_active_user),
@@ -81,16 +83,16 @@ async def get_my_products(
     products, total = product_service.get_products_by_seller(current_user.id, skip=skip, limit=size)
     total_pages = ceil(total / size) if total > 0 else 1
 
-    return ProductListResponse(
+    return json_response(ProductListResponse(
         products=[ProductResponse.model_validate(product) for product in products],
         total=total,
         page=page,
         size=size,
         total_pages=total_pages
-    )
+    ))
 
 @router.get("/locations", response_model=List[LocationInfo])
-async def get_all_locations(location_repo = Depends(get_location_repository)):
+def get_all_locations(location_repo = Depends(get_location_repository)):
     """Get all product locations"""
     locations = location_repo.get_all(skip=0, limit=1000)  # Get all locations
     return [LocationInfo.model_validate(loc) for loc in locations]
@@ -109,13 +111,13 @@ async def get_supported_currencies():
     return currencies
 
 @router.get("/categories", response_model=List[CategoryInfo])
-async def get_all_categories(product_service: ProductService = Depends(get_product_service)):
+def get_all_categories(product_service: ProductService = Depends(get_product_service)):
     """Get all product categories"""
     categories = product_service.get_all_categories()
     return [CategoryInfo.model_validate(cat) for cat in categories]
 
 @router.get("/productdetails", response_model=ProductDetailsResponse)
-async def get_all_product_details(
+def get_all_product_details(
     product_service: ProductService = Depends(get_product_service),
     location_repo = Depends(get_location_repository)
 ):
@@ -131,7 +133,7 @@ async def get_all_product_details(
     )
 
 @router.get("/category/{category}", response_model=ProductListResponse)
-async def get_products_by_category(
+def get_products_by_category(
     category: str,
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(20, ge=1, le=100, description="Items per page"),
@@ -142,16 +144,16 @@ async def get_products_by_category(
     products, total = product_service.get_products_by_category(category, skip=skip, limit=size)
     total_pages = ceil(total / size) if total > 0 else 1
 
-    return ProductListResponse(
+    return json_response(ProductListResponse(
         products=[ProductResponse.model_validate(product) for product in products],
         total=total,
         page=page,
         size=size,
         total_pages=total_pages
-    )
+    ))
 
 @router.get("/{product_id}", response_model=ProductResponse)
-async def get_product(
+def get_product(
     product_id: int, 
     current_user: Optional[User] = Depends(get_current_user_optional),
     product_service: ProductService = Depends(get_product_service)
@@ -164,7 +166,7 @@ async def get_product(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Product not found"
         )
-    return ProductResponse.model_validate(product_dict)
+    return json_response(ProductResponse.model_validate(product_dict))
 
 @router.post("/", response_model=ProductResponse, status_code=status.HTTP_201_CREATED)
 async def create_product(
@@ -41,7 +41,7 @@ class MessageService:
     ) -> Tuple[Conversation, Message]:
         """Start a new conversation about a product."""
         # Verify product exists
-        product = self.db.query(Product).filter(Product.id == product_id).first()
+        product = self.db.get(Product, product_id)
         if not product:
             raise HTTPException(status_code=404, detail="Product not found")
         
@@ -63,13 +63,12 @@ class MessageService:
         # Create first message
         msg = self.message_repo.create_message(conv.id, creator_id, first_message)
         
-        # Commit transaction
+        # Commit transaction; the rows stay attached, so the conversation's
+        # created_at/updated_at (SQL defaults) load on first access after the
+        # commit rather than by an explicit refresh. The message's created_at
+        # is set in Python by create_message
         self.message_repo.commit()
         
-        # Refresh to get relationships
-        self.db.refresh(conv)
-        self.db.refresh(msg)
-        
         return conv, msg
     
     def send_message(self, conversation_id: int, sender_id: int, body: str) -> Message:
@@ -78,24 +77,26 @@ class MessageService:
             raise HTTPException(status_code=403, detail="Not a participant")
         
         msg = self.message_repo.create_message(conversation_id, sender_id, body)
+        # create_message sets every column, created_at included, in Python, so
+        # detach the row before committing: it keeps its loaded values instead
+        # of being expired and re-selected
+        self.db.expunge(msg)
         self.message_repo.commit()
         
-        self.db.refresh(msg)
         return msg
     
     def edit_message(self, message_id: int, editor_id: int, new_body: str) -> Message:
         """Edit an existing message."""
-        msg = self.message_repo.get_message_by_id(message_id)
-        if not msg or msg.deleted_at:
-            raise HTTPException(status_code=404, detail="Message not found")
-        if msg.sender_id != editor_id:
+        # Ownership and liveness are part of the UPDATE; only a miss needs a lookup
+        if not self.message_repo.update_message(message_id, editor_id, new_body):
+            msg = self.message_repo.get_message_by_id(message_id)
+            if not msg or msg.deleted_at:
+                raise HTTPException(status_code=404, detail="Message not found")
             raise HTTPException(status_code=403, detail="Only the sender can edit")
         
-        updated_msg = self.message_repo.update_message(message_id, new_body)
         self.message_repo.commit()
         
-        self.db.refresh(updated_msg)
-        
+        updated_msg = self.message_repo.get_message_by_id(message_id)
         if not updated_msg:
             raise HTTPException(status_code=500, detail="Failed to update message")
         
@@ -103,14 +104,14 @@ class MessageService:
     
     def delete_message(self, message_id: int, requester_id: int) -> None:
         """Delete a message (soft delete)."""
-        msg = self.message_repo.get_message_by_id(message_id)
-        if not msg or msg.deleted_at:
+        if self.message_repo.soft_delete_message(message_id, requester_id):
+            self.message_repo.commit()
             return
-        if msg.sender_id != requester_id:
-            raise HTTPException(status_code=403, detail="Only the sender can delete")
         
-        self.message_repo.soft_delete_message(message_id)
-        self.message_repo.commit()
+        # Missing or already deleted messages are a no-op; someone else's is not
+        msg = self.message_repo.get_message_by_id(message_id)
+        if msg and not msg.deleted_at and msg.sender_id != requester_id:
+            raise HTTPException(status_code=403, detail="Only the sender can delete")
     
     def get_unread_count(self, conversation_id: int, user_id: int) -> int:
         """Get count of unread messages in a conversation for a user."""
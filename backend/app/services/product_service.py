@@ -1,14 +1,90 @@
 """Service class for product operations using the repository pattern."""
 from typing import List, Optional, Tuple
-import html
 
 from fastapi import HTTPException, status, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
 
+from app.cache import TTLCache
+from app.models.category import Category
 from app.models.product import Product
-from app.schemas.product_schema import ProductCreate, ProductFilter, ProductUpdate, ProductResponse
+from app.models.product_details import Color, Material, Tag
+from app.schemas.product_schema import (
+    CategoryInfo, ColorInfo, MaterialInfo, ProductCreate, ProductFilter, ProductUpdate, ProductResponse, TagInfo
+)
 from app.repositories.base import ProductRepositoryInterface, UserRepositoryInterface
 from app.services.file_upload_service import FileUploadService
 
+PRODUCT_CACHE_TTL_SECONDS = 60
+REFERENCE_DATA_TTL_SECONDS = 600
+
+# Detail responses by product id and listing pages by their query parameters.
+# Mutations made through this service drop the affected entries; the short TTL
+# bounds staleness for changes made elsewhere (other workers, likes, triggers).
+_product_detail_cache = TTLCache(maxsize=256, ttl=PRODUCT_CACHE_TTL_SECONDS)
+_product_page_cache = TTLCache(maxsize=128, ttl=PRODUCT_CACHE_TTL_SECONDS)
+
+# Categories and detail options (colors, materials, tags) change rarely but are
+# read on every filter render, so they are served from memory for a while and
+# dropped whenever this process writes to one of their tables.
+_reference_data_cache = TTLCache(maxsize=2, ttl=REFERENCE_DATA_TTL_SECONDS)
+
+# All cached values are schema models, never ORM instances bound to a session.
+
+
+def clear_product_response_cache() -> None:
+    """Drop all cached product details and listing pages."""
+    _product_detail_cache.clear()
+    _product_page_cache.clear()
+
+
+def clear_reference_data_cache() -> None:
+    """Drop cached categories and product detail options."""
+    _reference_data_cache.clear()
+
+
+# Writes to reference tables only mark their session; the cache is dropped once
+# that session commits. Dropping it at flush would let a concurrent reader cache
+# the pre-commit rows again for the full TTL.
+_REFERENCE_DATA_CHANGED = "reference_data_changed"
+
+
+def _on_reference_data_change(_mapper, _connection, target) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info[_REFERENCE_DATA_CHANGED] = True
+
+
+def _on_commit(session: Session) -> None:
+    if session.info.pop(_REFERENCE_DATA_CHANGED, False):
+        clear_reference_data_cache()
+
+
+def _on_rollback(session: Session) -> None:
+    session.info.pop(_REFERENCE_DATA_CHANGED, None)
+
+
+for _model in (Category, Color, Material, Tag):
+    for _event_name in ("after_insert", "after_update", "after_delete"):
+        event.listen(_model, _event_name, _on_reference_data_change)
+event.listen(Session, "after_commit", _on_commit)
+event.listen(Session, "after_rollback", _on_rollback)
+
+
+def _invalidate_product(product_id: Optional[int] = None) -> None:
+    if product_id is not None:
+        _product_detail_cache.delete(product_id)
+    _product_page_cache.clear()
+
+
+def _cached_reference_data(name: str, load):
+    value = _reference_data_cache.get(name)
+    if value is None:
+        value = load()
+        _reference_data_cache.set(name, value)
+    return value
+
 
 class ProductService:
     """Service class for product operations using the repository pattern."""
@@ -25,11 +101,23 @@ class ProductService:
 
     def get_all_details(self):
         """Fetch all colors, materials, and tags for product details dropdowns/filters."""
-        return self.product_repository.get_product_details_options()
+        return _cached_reference_data("details", self._load_details)
 
     def get_all_categories(self):
         """Get all product categories"""
-        return self.product_repository.get_all_categories()
+        return _cached_reference_data("categories", self._load_categories)
+
+    def _load_details(self) -> dict:
+        options = self.product_repository.get_product_details_options()
+        return {
+            "colors": tuple(ColorInfo.model_validate(color) for color in options["colors"]),
+            "materials": tuple(MaterialInfo.model_validate(mat) for mat in options["materials"]),
+            "tags": tuple(TagInfo.model_validate(tag) for tag in options["tags"]),
+        }
+
+    def _load_categories(self) -> tuple:
+        categories = self.product_repository.get_all_categories()
+        return tuple(CategoryInfo.model_validate(cat) for cat in categories)
 
     async def create_product(self, product: ProductCreate, seller_id: int, image_files: Optional[List[UploadFile]] = None) -> Product:
         """Create a new product listing with optional images."""
@@ -42,7 +130,9 @@ class ProductService:
             if saved_image_urls:
                 product.image_urls = saved_image_urls
             
-            return self.product_repository.create(product, seller_id)
+            created_product = await run_in_threadpool(self.product_repository.create, product, seller_id)
+            _invalidate_product()
+            return created_product
             
         except Exception:
             if saved_image_urls:
@@ -51,19 +141,29 @@ class ProductService:
 
     def get_product_by_id(self, product_id: int, current_user_id: Optional[int] = None) -> Optional[ProductResponse]:
         """Get product by ID with all details and counters."""
-        product = self.product_repository.get_by_id(product_id, load_details=True)
+        product_response = _product_detail_cache.get(product_id)
         
-        if not product:
-            return None
+        if product_response is None:
+            product = self.product_repository.get_by_id(product_id, load_details=True)
+            if not product:
+                return None
+            # Serialize before recording the view: record_view commits, which
+            # expires the loaded instance
+            product_response = ProductResponse.model_validate(product)
+            _product_detail_cache.set(product_id, product_response)
         
-        if current_user_id != product.seller_id and product.status not in ['active', 'sold']:
+        if current_user_id != product_response.seller_id and product_response.status not in ['active', 'sold']:
             return None
         
-        if current_user_id and current_user_id != product.seller_id:
-            self.product_repository.record_view(product_id, current_user_id)
-            product = self.product_repository.get_by_id(product_id, load_details=True)
+        if current_user_id and current_user_id != product_response.seller_id:
+            if self.product_repository.record_view(product_id, current_user_id):
+                # The item_views trigger added exactly one view; mirror it
+                # instead of loading the whole product again
+                product_response = product_response.model_copy(
+                    update={"views_count": product_response.views_count + 1}
+                )
+                _product_detail_cache.set(product_id, product_response)
         
-        product_response = ProductResponse.model_validate(product)
         return product_response
 
     def get_products(
@@ -73,40 +173,41 @@ class ProductService:
         filter_params: Optional[ProductFilter] = None,
         sort_field: Optional[str] = None,
         sort_direction: str = 'desc'
-    ) -> Tuple[List[Product], int]:
+    ) -> Tuple[List[ProductResponse], int]:
         """Get products with filtering, pagination and sorting"""
-        products = self.product_repository.get_all_filtered(
-            filters=filter_params,
-            skip=skip,
-            limit=limit,
-            load_details=False,
-            sort_field=sort_field,
-            sort_direction=sort_direction
+        cache_key = (
+            filter_params.model_dump_json() if filter_params else None,
+            skip, limit, sort_field, sort_direction
         )
+        page = _product_page_cache.get(cache_key)
         
-        total = self.product_repository.count_filtered(filter_params)
+        if page is None:
+            rows, total = self.product_repository.get_page_with_total(
+                filters=filter_params,
+                skip=skip,
+                limit=limit,
+                sort_field=sort_field,
+                sort_direction=sort_direction
+            )
+            page = (tuple(ProductResponse.model_validate(row) for row in rows), total)
+            _product_page_cache.set(cache_key, page)
         
-        return products, total
+        responses, total = page
+        return list(responses), total
 
-    def get_products_by_seller(self, seller_id: int, skip: int = 0, limit: int = 20) -> Tuple[List[Product], int]:
+    def get_products_by_seller(self, seller_id: int, skip: int = 0, limit: int = 20) -> Tuple[List[ProductResponse], int]:
         """Get products by seller with pagination"""
-        products = self.product_repository.get_by_seller(seller_id, skip, limit)
-        total = self.product_repository.count_by_seller(seller_id)
-        return products, total
+        rows, total = self.product_repository.get_by_seller_with_total(seller_id, skip, limit)
+        return [ProductResponse.model_validate(row) for row in rows], total
 
-    def get_products_by_category(self, category: str, skip: int = 0, limit: int = 20) -> Tuple[List[Product], int]:
+    def get_products_by_category(self, category: str, skip: int = 0, limit: int = 20) -> Tuple[List[ProductResponse], int]:
         """Get products by category with pagination"""
-        products = self.product_repository.get_by_category(category, skip, limit)
-        # For category filtering, we need to count separately since repository doesn't have this method
-        # We'll use get_by_category for both count and data for simplicity
-        # In a real implementation, you might add a count_by_category method to the repository
-        all_products = self.product_repository.get_by_category(category, skip=0, limit=10000)
-        total = len(all_products)
-        return products, total
+        rows, total = self.product_repository.get_by_category_with_total(category, skip, limit)
+        return [ProductResponse.model_validate(row) for row in rows], total
 
     async def update_product(self, product_id: int, product_update: ProductUpdate, user_id: int, is_admin: bool = False, image_files: Optional[List[UploadFile]] = None) -> Product:
         """Update an existing product with optional new images."""
-        product = self.product_repository.get_by_id(product_id)
+        product = await run_in_threadpool(self.product_repository.get_auth_fields, product_id)
         
         if not product:
             raise HTTPException(
@@ -134,7 +235,8 @@ class ProductService:
                         status_code=status.HTTP_400_BAD_REQUEST,
                         detail="Product must have a price to be marked as sold"
                     )
-                success = self.product_repository.archive_sold_product(
+                success = await run_in_threadpool(
+                    self.product_repository.archive_sold_product,
                     product_id=product_id,
                     buyer_id=None,
                     sale_price=float(product.price_amount)
@@ -144,12 +246,13 @@ class ProductService:
                         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                         detail="Failed to mark product as sold"
                     )
-                updated_product = self.product_repository.get_by_id(product_id)
+                updated_product = await run_in_threadpool(self.product_repository.get_by_id, product_id)
                 deleted_image_urls: list[str] = []
             else:
                 # Regular update
-                updated_product, deleted_image_urls = self.product_repository.update(
-                    product_id, 
+                updated_product, deleted_image_urls = await run_in_threadpool(
+                    self.product_repository.update,
+                    product_id,
                     product_update,
                     new_image_urls=saved_image_urls
                 )
@@ -160,6 +263,7 @@ class ProductService:
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                     detail="Failed to update product",
             )
+            _invalidate_product(product_id)
             if deleted_image_urls:
                 await self.file_upload_service.delete_images(deleted_image_urls)
             
@@ -172,7 +276,12 @@ class ProductService:
 
     async def delete_product(self, product_id: int, user_id: int) -> bool:
         """Delete a product (soft delete, only owner can delete)."""
-        product = self.product_repository.get_by_id(product_id)
+        if await run_in_threadpool(self.product_repository.soft_delete, product_id, user_id):
+            _invalidate_product(product_id)
+            return True
+        
+        # Nothing was deleted; only now look up why
+        product = await run_in_threadpool(self.product_repository.get_auth_fields, product_id)
         if not product:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -184,19 +293,20 @@ class ProductService:
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not authorized to delete this product"
             )
-        
-        return self.product_repository.soft_delete(product_id)
+        return False
 
     async def force_delete_product(self, product_id: int) -> bool:
         """
         Force delete a product (admin only, hard delete).
         Deletes product and all associated images.
         """
-        deleted_image_urls = self.product_repository.delete(product_id)
+        deleted_image_urls = await run_in_threadpool(self.product_repository.delete, product_id)
         
         if deleted_image_urls is None:
             return False
         
+        _invalidate_product(product_id)
+        
         # Clean up image files
         if deleted_image_urls:
             await self.file_upload_service.delete_images(deleted_image_urls)
@@ -216,11 +326,9 @@ class ProductService:
                 detail="Search term is too long (maximum 100 characters)"
             )
         
-        # Sanitize input to prevent XSS attacks
-        # html.escape converts special characters like <, >, &, etc.
-        sanitized_query = html.escape(query.strip())
-        
-        return self.product_repository.search_by_title(sanitized_query, skip, limit)
+        # The term is sent as a bound parameter, so it needs no escaping here;
+        # HTML-escaping would also break matches on titles containing "&" or "<"
+        return self.product_repository.search_by_title(query.strip(), skip, limit)
 
     def get_recent_products(self, limit: int = 10) -> List[Product]:
         """Get most recently created products"""
@@ -228,7 +336,7 @@ class ProductService:
 
     def mark_product_as_sold(self, product_id: int, user_id: int, is_admin: bool = False) -> Product:
         """Mark a product as sold using stored procedure"""
-        product = self.product_repository.get_by_id(product_id)
+        product = self.product_repository.get_auth_fields(product_id)
         
         if not product:
             raise HTTPException(
@@ -263,6 +371,8 @@ class ProductService:
                 detail="Failed to mark product as sold"
             )
         
+        _invalidate_product(product_id)
+        
         # Fetch updated product
         updated_product = self.product_repository.get_by_id(product_id)
         if updated_product is None:
@@ -285,7 +395,7 @@ class ProductService:
 
     def toggle_product_status(self, product_id: int, user_id: int, is_admin: bool = False) -> Product:
         """Toggle product between active and paused status"""
-        product = self.product_repository.get_by_id(product_id)
+        product = self.product_repository.get_auth_fields(product_id)
         
         if not product:
             raise HTTPException(
@@ -304,6 +414,7 @@ class ProductService:
         new_status = "paused" if product.status == "active" else "active"
         update_data = ProductUpdate.model_validate({"status": new_status})
         updated_product, _ = self.product_repository.update(product_id, update_data)
+        _invalidate_product(product_id)
         if updated_product is None:
             raise HTTPException(
               status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
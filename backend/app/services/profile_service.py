@@ -2,10 +2,23 @@
 from typing import Optional, List
 from fastapi import HTTPException, status
 
+from app.cache import TTLCache
 from app.models.user import User
 from app.schemas.user_schema import UserUpdate, ProfileUpdate, UserProfileResponse, PublicUserProfile
 from app.schemas.location_schema import LocationCreate
 from app.repositories.base import UserRepositoryInterface, ProductRepositoryInterface, LocationRepositoryInterface
+from app.services.product_service import clear_product_response_cache
+
+PUBLIC_PROFILE_TTL_SECONDS = 60
+
+# Public profiles by user id. Changes made through this service drop the entry;
+# the short TTL bounds staleness for product counts and admin-side changes.
+_public_profile_cache = TTLCache(maxsize=256, ttl=PUBLIC_PROFILE_TTL_SECONDS)
+
+
+def clear_public_profile_cache() -> None:
+    """Drop all cached public profiles."""
+    _public_profile_cache.clear()
 
 
 class ProfileService:
@@ -23,15 +36,13 @@ class ProfileService:
 
     def get_user_profile(self, user_id: int) -> Optional[UserProfileResponse]:
         """Get detailed user profile with product count"""
-        user = self.user_repository.get_by_id(user_id)
-        if not user:
+        result = self.user_repository.get_with_product_count(user_id)
+        if not result:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
-
-        # Get product count
-        product_count = self.product_repository.count_by_seller(user_id)
+        user, product_count = result
 
         # Convert to response model
         user_data = UserProfileResponse.model_validate(user)
@@ -40,20 +51,20 @@ class ProfileService:
 
     def get_public_profile(self, user_id: int) -> Optional[PublicUserProfile]:
         """Get public user profile (visible to all users)"""
-        user = self.user_repository.get_by_id(user_id)
+        public_profile = _public_profile_cache.get(user_id)
+        if public_profile is not None:
+            return public_profile
+        
+        result = self.user_repository.get_with_product_count(user_id)
 
-        if not user or not user.is_active:
+        if not result or not result[0].is_active:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found or inactive"
             )
+        user, product_count = result
 
-        # Get active product count for public profile
-        # Note: We would need a count_active_by_seller method in the repository for exact behavior
-        # For now, using the general count method
-        product_count = self.product_repository.count_by_seller(user_id)
-
-        return PublicUserProfile(
+        public_profile = PublicUserProfile(
             id=user.id,
             username=user.username,
             full_name=user.full_name,
@@ -61,6 +72,8 @@ class ProfileService:
             created_at=user.created_at,
             product_count=product_count
         )
+        _public_profile_cache.set(user_id, public_profile)
+        return public_profile
 
     def update_profile(self, user_id: int, profile_update: ProfileUpdate) -> User:
         """Update user profile information"""
@@ -74,6 +87,7 @@ class ProfileService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
+        _public_profile_cache.delete(user_id)
         return user
 
     def add_user_location(self, user_id: int, location_data: LocationCreate) -> User:
@@ -98,6 +112,7 @@ class ProfileService:
                 detail="Failed to update user location"
             )
         
+        _public_profile_cache.delete(user_id)
         return updated_user
 
     def remove_user_location(self, user_id: int) -> User:
@@ -119,31 +134,31 @@ class ProfileService:
                 detail="Failed to remove user location"
             )
         
+        _public_profile_cache.delete(user_id)
         return updated_user
 
     def get_user_products(self, user_id: int, skip: int = 0, limit: int = 20) -> List:
         """Get products by user"""
-        # Verify user exists
-        user = self.user_repository.get_by_id(user_id)
-        if not user:
+        products = self.product_repository.get_by_seller(user_id, skip, limit)
+        
+        # Only an empty page needs the user lookup to tell "no products" from "no user"
+        if not products and not self.user_repository.get_by_id(user_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
 
-        return self.product_repository.get_by_seller(user_id, skip, limit)
+        return products
 
     def get_user_statistics(self, user_id: int) -> dict:
         """Get user statistics"""
-        # Verify user exists
-        user = self.user_repository.get_by_id(user_id)
-        if not user:
+        result = self.user_repository.get_with_product_count(user_id)
+        if not result:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
-
-        product_count = self.product_repository.count_by_seller(user_id)
+        user, product_count = result
         
         return {
             "total_products": product_count,
@@ -161,17 +176,8 @@ class ProfileService:
                 detail="User not found"
             )
         
-        # Delete user's products first
-        user_products = self.product_repository.get_by_seller(user_id, skip=0, limit=1000)
-        
-        for product in user_products:
-            success = self.product_repository.delete(product.id)
-            if not success:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Failed to delete product {product.id}"
-                )
-        
+        # The user's products, soft-deleted ones included, go in the same
+        # transaction as the user
         deleted = self.user_repository.delete(user_id)
         if not deleted:
             raise HTTPException(
@@ -179,4 +185,8 @@ class ProfileService:
                 detail="Failed to delete user"
             )
         
+        _public_profile_cache.delete(user_id)
+        # The user's products are gone; drop every cached listing and detail
+        # rather than tracking which cached entries were theirs
+        clear_product_response_cache()
         return True
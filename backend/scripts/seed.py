@@ -2,12 +2,15 @@ import logging
 import random
 import re
 import unicodedata
+from itertools import accumulate
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
 from faker import Faker
 import requests
+from requests.adapters import HTTPAdapter
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import insert
 
 from app.db.mysql import SessionLocal
 from app.models.user import User
@@ -15,6 +18,7 @@ from app.models.location import Location
 from app.models.category import Category
 from app.models.product import Product
 from app.models.product_details import Color, Material, Tag
+from app.models.product_details import ProductColor, ProductMaterial, ProductTag
 from app.models.product_images import ProductImage
 from app.models.price_history import ProductPriceHistory
 from app.models.favorites import Favorite
@@ -25,12 +29,25 @@ from app.services.auth_service import AuthService
 
 fake = Faker("da_DK")
 logger = logging.getLogger(__name__)
-_image_cache = {}
+# Image URLs per category key, filled by one Unsplash search per category
+_image_pool = {}
+IMAGE_FETCH_WORKERS = 16
+FALLBACK_IMAGES = ["/images/city-bike.jpg", "/images/mountain-bike.jpg", "/images/racing-bike.jpg"]
+# One keep-alive session so image lookups reuse the TLS connection to Unsplash
+_HTTP = requests.Session()
+_HTTP.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+ADMIN_EMAIL = "admin@test.com"
 USERNAME_PATTERN = re.compile(r'^[a-zA-Z0-9_.-]{3,30}$')
-def fetch_unsplash_bike_image(category, title=None):
-    key = (category.lower(), title)
-    if key in _image_cache:
-        return _image_cache[key]
+_USERNAME_STRIP_RE = re.compile(r"[^a-zA-Z0-9_.]")
+
+
+def _image_pool_key(category):
+    """Map a category name such as "Road Bikes" to its search key ("road")."""
+    return category.split()[0].lower()
+
+
+def _fetch_image_pool(key):
+    """Search Unsplash once for a category key and return every result's image URL."""
     access_key = "yt1xioJLpxXE3zhkoHIt4SMDifGsWTQe05sIX6ysnck" # "ghdemshFN49d3S0RbExlmtShkG5MK0e9-o6fzqk1-ns"
     style_words = ["used", "second hand", "old", "vintage", "worn", "garage", "street", "for sale"]
     category_map = {
@@ -42,51 +59,69 @@ def fetch_unsplash_bike_image(category, title=None):
         "bmx": ["bmx bike"],
         "hybrid": ["hybrid bicycle"],
     }
-    base_terms = category_map.get(category.lower(), ["bicycle"])
-    title_word = title.split()[0].lower() if title else ""
+    base_terms = category_map.get(key, ["bicycle"])
     style = random.choice(style_words)
     base_term = random.choice(base_terms)
-    query = f"{style} {base_term} {title_word}".strip()
+    query = f"{style} {base_term}"
     url = f"https://api.unsplash.com/search/photos?query={query}&orientation=landscape&per_page=30&content_filter=low&client_id={access_key}"
     try:
-        resp = requests.get(url, timeout=1)
+        resp = _HTTP.get(url, timeout=1)
         if resp.status_code == 200:
-            data = resp.json()
-            if data["results"]:
-                img_url = random.choice(data["results"])["urls"]["regular"]
-                _image_cache[key] = img_url
-                return img_url
+            return [result["urls"]["regular"] for result in resp.json()["results"]]
     except Exception:
-        logger.debug("Falling back to local images for %s (%s)", category, title)
-    fallbacks = ["/images/city-bike.jpg", "/images/mountain-bike.jpg", "/images/racing-bike.jpg"]
-    img_url = random.choice(fallbacks)
-    _image_cache[key] = img_url
-    return img_url
+        logger.debug("Falling back to local images for %s", key)
+    return []
+
+
+def _prefetch_image_pools(categories):
+    """Load the image pools of several categories, one concurrent search each."""
+    keys = list({_image_pool_key(category) for category in categories} - _image_pool.keys())
+    with ThreadPoolExecutor(max_workers=IMAGE_FETCH_WORKERS) as executor:
+        for key, urls in zip(keys, executor.map(_fetch_image_pool, keys)):
+            _image_pool[key] = urls or FALLBACK_IMAGES
+
+
+def fetch_unsplash_bike_image(category):
+    """Pick an image URL for a category from its pool, searching Unsplash on first use."""
+    key = _image_pool_key(category)
+    if key not in _image_pool:
+        _image_pool[key] = _fetch_image_pool(key) or FALLBACK_IMAGES
+    return random.choice(_image_pool[key])
+
+
+# Every table the seed fills, children before parents so the DELETE fallback
+# never trips a foreign key
+_SEEDED_TABLES = (
+    "messages",
+    "conversation_participants",
+    "conversations",
+    "item_views",
+    "favorites",
+    "sold_item_archive",
+    "product_price_history",
+    "product_images",
+    "product_colors",
+    "product_materials",
+    "product_tags",
+    "products",
+    "users",
+    "categories",
+    "colors",
+    "materials",
+    "tags",
+    "locations",
+)
 
 
 def _clear_database(db: Session) -> Session:
     """Clear existing data while handling foreign key constraints."""
     try:
-        db.execute(text("SET FOREIGN_KEY_CHECKS = 0"))
-        db.execute(text("TRUNCATE TABLE messages"))
-        db.execute(text("TRUNCATE TABLE conversation_participants"))
-        db.execute(text("TRUNCATE TABLE conversations"))
-        db.execute(text("TRUNCATE TABLE item_views"))
-        db.execute(text("TRUNCATE TABLE favorites"))
-        db.execute(text("TRUNCATE TABLE sold_item_archive"))
-        db.execute(text("TRUNCATE TABLE product_price_history"))
-        db.execute(text("TRUNCATE TABLE product_images"))
-        db.execute(text("TRUNCATE TABLE product_colors"))
-        db.execute(text("TRUNCATE TABLE product_materials"))
-        db.execute(text("TRUNCATE TABLE product_tags"))
-        db.execute(text("TRUNCATE TABLE products"))
-        db.execute(text("TRUNCATE TABLE users"))
-        db.execute(text("TRUNCATE TABLE categories"))
-        db.execute(text("TRUNCATE TABLE colors"))
-        db.execute(text("TRUNCATE TABLE materials"))
-        db.execute(text("TRUNCATE TABLE tags"))
-        db.execute(text("TRUNCATE TABLE locations"))
-        db.execute(text("SET FOREIGN_KEY_CHECKS = 1"))
+        # Plain driver SQL on one connection; nothing here needs statement compilation
+        connection = db.connection()
+        connection.exec_driver_sql("SET FOREIGN_KEY_CHECKS = 0")
+        for table in _SEEDED_TABLES:
+            connection.exec_driver_sql(f"TRUNCATE TABLE {table}")
+        connection.exec_driver_sql("SET FOREIGN_KEY_CHECKS = 1")
         db.commit()
         logger.info("Database cleared before seeding.")
         db.close()
@@ -94,26 +129,14 @@ def _clear_database(db: Session) -> Session:
     except Exception as exc:
         db.rollback()
         logger.warning("Error during clearing: %s. Falling back to delete statements.", exc)
-        db.execute(text("DELETE FROM messages"))
-        db.execute(text("DELETE FROM conversation_participants"))
-        db.execute(text("DELETE FROM conversations"))
-        db.execute(text("DELETE FROM item_views"))
-        db.execute(text("DELETE FROM favorites"))
-        db.execute(text("DELETE FROM sold_item_archive"))
-        db.execute(text("DELETE FROM product_price_history"))
-        db.execute(text("DELETE FROM product_images"))
-        db.execute(text("DELETE FROM product_colors"))
-        db.execute(text("DELETE FROM product_materials"))
-        db.execute(text("DELETE FROM product_tags"))
-        db.execute(text("DELETE FROM products"))
-        db.execute(text("DELETE FROM users"))
-        # Delete child categories first, then parent categories
-        db.execute(text("DELETE FROM categories WHERE parent_id IS NOT NULL"))
-        db.execute(text("DELETE FROM categories WHERE parent_id IS NULL"))
-        db.execute(text("DELETE FROM colors"))
-        db.execute(text("DELETE FROM materials"))
-        db.execute(text("DELETE FROM tags"))
-        db.execute(text("DELETE FROM locations"))
+        connection = db.connection()
+        for table in _SEEDED_TABLES:
+            if table == "categories":
+                # Delete child categories first, then parent categories
+                connection.exec_driver_sql("DELETE FROM categories WHERE parent_id IS NOT NULL")
+                connection.exec_driver_sql("DELETE FROM categories WHERE parent_id IS NULL")
+            else:
+                connection.exec_driver_sql(f"DELETE FROM {table}")
         db.commit()
         logger.info("Database cleared using fallback method.")
         return db
@@ -122,7 +145,7 @@ def _normalize_username(value: str) -> str:
     """Convert arbitrary strings to ASCII-safe usernames matching our pattern."""
     normalized = unicodedata.normalize("NFKD", value)
     ascii_only = normalized.encode("ascii", "ignore").decode("ascii")
-    cleaned = re.sub(r"[^a-zA-Z0-9_.]", "", ascii_only).lower()
+    cleaned = _USERNAME_STRIP_RE.sub("", ascii_only).lower()
     if len(cleaned) < 3:
         cleaned = f"user{random.randint(100, 999)}"
     return cleaned[:50]
@@ -131,8 +154,9 @@ def _normalize_username(value: str) -> str:
 def _sanitize_existing_usernames(db: Session) -> int:
     """Ensure all stored usernames match the enforced pattern."""
     updated = 0
-    existing_usernames = {u.username for u in db.query(User.username).all()}
-    for user in db.query(User).all():
+    users = db.query(User).all()
+    existing_usernames = {u.username for u in users}
+    for user in users:
         if USERNAME_PATTERN.match(user.username or ""):
             continue
 
@@ -152,19 +176,17 @@ def _sanitize_existing_usernames(db: Session) -> int:
 
 def _ensure_admin_user(db: Session, default_location: Location | None = None) -> User:
     """Create admin user if missing to keep initialization idempotent."""
-    existing_admin = db.query(User).filter(User.email == "admin@test.com").first()
+    existing_admin = db.query(User).filter(User.email == ADMIN_EMAIL).first()
     if existing_admin:
         return existing_admin
 
     location = default_location or db.query(Location).first()
     if not location:
+        # Saved by cascade with the admin user below, in the same commit
         location = Location(city="Copenhagen", postcode="1000")
-        db.add(location)
-        db.commit()
-        db.refresh(location)
 
     admin_user = User(
-        email="admin@test.com",
+        email=ADMIN_EMAIL,
         username="admin",
         full_name="Admin User",
         hashed_password=AuthService.get_password_hash("admin123"),
@@ -174,9 +196,10 @@ def _ensure_admin_user(db: Session, default_location: Location | None = None) ->
         phone="+4512345678",
     )
     db.add(admin_user)
+    # The flush reads the new ids from the INSERTs, so no refresh is needed;
+    # anything used after the commit is reloaded on first access
     db.commit()
-    db.refresh(admin_user)
-    logger.info("Created admin user %s", admin_user.email)
+    logger.info("Created admin user %s", ADMIN_EMAIL)
     return admin_user
 
 
@@ -226,6 +249,11 @@ def seed_database_non_interactive(reset_existing: bool = False, log: logging.Log
         db.close()
 
 
+def _as_utc(value: datetime) -> datetime:
+    """Treat a naive datetime (as read back from MySQL) as UTC."""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
 def seed_locations(session: Session):
     dk_cities = [
         ("Copenhagen", "1000"),
@@ -263,7 +291,10 @@ def seed_locations(session: Session):
 
 def seed_users(session: Session, n=150, locations=None):
     users = []
-    for _ in range(n):
+    user_locations = random.choices(locations, k=n) if locations else [None] * n
+    # Every seeded user shares a password, so pay for the deliberately slow hash once
+    shared_password_hash = AuthService.get_password_hash("password123")
+    for location in user_locations:
         first = fake.first_name()
         last = fake.last_name()
         full_name = f"{first} {last}"
@@ -293,11 +324,11 @@ def seed_users(session: Session, n=150, locations=None):
 
         u = User(
             email=email,
-            hashed_password=AuthService.get_password_hash("password123"),
+            hashed_password=shared_password_hash,
             username=username,
             is_admin=False,
             is_active=True,
-            location=random.choice(locations) if locations else None,
+            location=location,
             full_name=full_name,
             phone=phone,
         )
@@ -349,22 +380,64 @@ def seed_products(session: Session, users, categories, locations, colors, materi
         "Cube": ["Aero", "Racing", "Cross", "Reaction", "Stereo", "Nuroad"]
     }
 
+    # price ranges with realistic variations, resolved per category once
+    base_prices = {
+        "Bicycles": (2000, 8000),
+        "Road Bikes": (8000, 45000),
+        "Mountain Bikes": (6000, 35000),
+        "Gravel Bikes": (10000, 40000),
+        "BMX": (2000, 8000),
+        "Electric Bikes": (5000, 30000),
+        "Folding Bikes": (3000, 9000),
+        "Kids Bikes": (250, 5000),
+    }
+    category_price_ranges = {
+        category.id: base_prices.get(category.name, (2000, 20000)) for category in categories
+    }
+    brands = list(brand_models)
+
+    features = [
+        "carbon frame", "aluminum frame", "disc brakes", "rim brakes",
+        "electronic shifting", "mechanical shifting", "carbon wheels",
+        "integrated cockpit", "drop handlebars", "flat handlebars", "new brakes"
+    ]
+
+    purposes = [
+        "daily commuting", "road racing", "mountain biking", "gravel riding",
+        "urban cycling", "touring", "trail riding", "enduro riding"
+    ]
+
+    # One image search per category up front; every product image is then picked locally
+    _prefetch_image_pools(c.name for c in categories)
+
     conditions = ["new", "like_new", "good", "fair", "needs_repair"]
     condition_weights = [0.1, 0.3, 0.4, 0.15, 0.05]
 
     products = []
-
-    for i in range(100):
-        seller = random.choice(users)
-
+    detail_picks = []
+
+    # Per-product picks that do not depend on each other are drawn in one call each
+    product_count = 100
+    days_old_weights = [0.1, 0.15, 0.2, 0.25, 0.3]
+    # Weighted picks made once per product reuse precomputed cumulative weights
+    price_type_cum_weights = list(accumulate([0.7, 0.3]))
+    color_count_cum_weights = list(accumulate([0.5, 0.3, 0.2]))
+    tag_count_cum_weights = list(accumulate([0.2, 0.5, 0.3]))
+    sellers = random.choices(users, k=product_count)
+    product_locations = random.choices(locations, k=product_count)
+    product_conditions = random.choices(conditions, weights=condition_weights, k=product_count)
+    product_days_old = random.choices([30, 90, 180, 270, 365*2], weights=days_old_weights, k=product_count)
+    now_utc = datetime.now(timezone.utc)
+
+    for i, (seller, loc, condition, days_old) in enumerate(
+        zip(sellers, product_locations, product_conditions, product_days_old)
+    ):
         if random.random() < 0.15:
             category = categories[0]
         else:
             category = random.choice(categories[1:])
 
-        loc = random.choice(locations)
-
-        brand = random.choice(list(brand_models.keys()))
+        brand = random.choice(brands)
         bike_type = category.name
 
         if brand in brand_models:
@@ -380,33 +453,10 @@ def seed_products(session: Session, users, categories, locations, colors, materi
         ]
         title = random.choice(title_patterns)
 
-        # price ranges with realistic variations
-        base_prices = {
-            "Bicycles": (2000, 8000),
-            "Road Bikes": (8000, 45000),
-            "Mountain Bikes": (6000, 35000),
-            "Gravel Bikes": (10000, 40000),
-            "BMX": (2000, 8000),
-            "Electric Bikes": (5000, 30000),
-            "Folding Bikes": (3000, 9000),
-            "Kids Bikes": (250, 5000),
-        }
-
-        min_price, max_price = base_prices.get(bike_type, (2000, 20000))
+        min_price, max_price = category_price_ranges[category.id]
         price = random.randint(min_price, max_price)
         price = int(round(float(price) / 10.0) * 10)
 
-        features = [
-            "carbon frame", "aluminum frame", "disc brakes", "rim brakes",
-            "electronic shifting", "mechanical shifting", "carbon wheels",
-            "integrated cockpit", "drop handlebars", "flat handlebars", "new brakes"
-        ]
-
-        purposes = [
-            "daily commuting", "road racing", "mountain biking", "gravel riding",
-            "urban cycling", "touring", "trail riding", "enduro riding"
-        ]
-
         description_templates = [
             f"Excellent {bike_type.lower()} from {brand}. This {model} features a {random.choice(['lightweight', 'durable', 'high-performance'])} {random.choice(features)} and is perfect for {random.choice(purposes)}. {fake.paragraph(nb_sentences=2)}",
             f"Well-maintained {brand} {model} {bike_type.lower()}. Great for {random.choice(purposes)} with {random.choice(features)}. {fake.paragraph(nb_sentences=2)}",
@@ -414,7 +464,6 @@ def seed_products(session: Session, users, categories, locations, colors, materi
         ]
 
         description = random.choice(description_templates)
-        condition = random.choices(conditions, weights=condition_weights)[0]
 
         # Some products have quantity > 1 (bulk sellers)
         quantity = 1 if random.random() < 0.85 else random.randint(2, 5)
@@ -423,13 +472,11 @@ def seed_products(session: Session, users, categories, locations, colors, materi
         if condition == "new":
             price_type = random.choice(["fixed", "negotiable"])
         else:
-            price_type = random.choices(["fixed", "negotiable"], weights=[0.7, 0.3])[0]
+            price_type = random.choices(["fixed", "negotiable"], cum_weights=price_type_cum_weights)[0]
 
         status = "active" if i < 80 else "sold"
 
-        days_old_weights = [0.1, 0.15, 0.2, 0.25, 0.3]
-        days_old = random.choices([30, 90, 180, 270, 365*2], weights=days_old_weights)[0]
-        created_at = datetime.now(timezone.utc) - timedelta(days=random.randint(1, days_old))
+        created_at = now_utc - timedelta(days=random.randint(1, days_old))
 
         prod = Product(
             seller=seller,
@@ -446,30 +493,47 @@ def seed_products(session: Session, users, categories, locations, colors, materi
             created_at=created_at,
         )
 
-        prod.colors = random.sample(colors, k=random.choices([1, 2, 3], weights=[0.5, 0.3, 0.2])[0])
-        prod.materials = random.sample(materials, k=1)
-        prod.tags = random.sample(tags, k=random.choices([0, 1, 2], weights=[0.2, 0.5, 0.3])[0])
+        detail_picks.append((
+            random.sample(colors, k=random.choices([1, 2, 3], cum_weights=color_count_cum_weights)[0]),
+            random.sample(materials, k=1),
+            random.sample(tags, k=random.choices([0, 1, 2], cum_weights=tag_count_cum_weights)[0]),
+        ))
         session.add(prod)
         products.append(prod)
-    session.commit()
-        
-    # add images + price history
+    # Flush rather than commit: the products get their ids and stay loaded for
+    # the rows below, and everything is committed together at the end
+    session.flush()
+
+    # Colors, materials and tags go straight into the link tables instead of
+    # through the relationship collections
+    color_rows = []
+    material_rows = []
+    tag_rows = []
+    for p, (product_colors, product_materials, product_tags) in zip(products, detail_picks):
+        color_rows.extend({"product_id": p.id, "color_id": c.id} for c in product_colors)
+        material_rows.extend({"product_id": p.id, "material_id": m.id} for m in product_materials)
+        tag_rows.extend({"product_id": p.id, "tag_id": t.id} for t in product_tags)
+    session.execute(insert(ProductColor), color_rows)
+    session.execute(insert(ProductMaterial), material_rows)
+    if tag_rows:
+        session.execute(insert(ProductTag), tag_rows)
+
+    # add images + price history, collected as rows for one multi-row INSERT each
+    image_rows = []
+    history_rows = []
     for p in products:
         for i in range(random.randint(1, 3)):
-            img = ProductImage(
-                product=p,
-                url=fetch_unsplash_bike_image(category=p.category.name, title=p.title),
-                alt_text=f"{p.title} photo",
-                sort_order=i,
-            )
-            session.add(img)
+            image_rows.append({
+                "product_id": p.id,
+                "url": fetch_unsplash_bike_image(p.category.name),
+                "alt_text": f"{p.title} photo",
+                "sort_order": i,
+            })
 
         # Generate price history with unique timestamps
         num_changes = random.randint(0, 4)
         if num_changes > 0:
-            # Ensure both datetimes are timezone-aware
-            now_utc = datetime.now(timezone.utc)
-            created_at_utc = p.created_at.replace(tzinfo=timezone.utc) if p.created_at.tzinfo is None else p.created_at
+            created_at_utc = _as_utc(p.created_at)
             days_since_creation = max(1, (now_utc - created_at_utc).days)
 
             # Generate unique days_before values
@@ -487,102 +551,119 @@ def seed_products(session: Session, users, categories, locations, colors, materi
 
                 if hist_amount != int(p.price_amount):
                     changed_at = created_at_utc - timedelta(days=days_before)
-                    hist = ProductPriceHistory(
-                        product=p,
-                        amount=hist_amount,
-                        currency="DKK",
-                        changed_at=changed_at,
-                    )
-                    session.add(hist)
-
+                    history_rows.append({
+                        "product_id": p.id,
+                        "amount": hist_amount,
+                        "currency": "DKK",
+                        "changed_at": changed_at,
+                    })
+
+    session.execute(insert(ProductImage), image_rows)
+    if history_rows:
+        session.execute(insert(ProductPriceHistory), history_rows)
     session.commit()
     return products
 
 
 def seed_sold_archive(session: Session, products):
     sold = [p for p in products if p.status == "sold"]
+    archive_rows = []
+    now_utc = datetime.now(timezone.utc)
+    days_ago_cum_weights = list(accumulate([0.4, 0.3, 0.2, 0.07, 0.03]))  # Favor recent sales
     for p in sold:
-        days_ago_weights = [0.4, 0.3, 0.2, 0.07, 0.03]  # Favor recent sales
-        days_ago = random.choices([7, 30, 90, 180, 365], weights=days_ago_weights)[0]
-        sold_at = datetime.now(timezone.utc) - timedelta(days=random.randint(1, days_ago))
-
-        archive = SoldItemArchive(
-            product_id=p.id,
-            title=p.title,
-            category_id=p.category_id,
-            location_id=p.location_id,
-            price_amount=p.price_amount,
-            price_currency=p.price_currency,
-            sold_at=sold_at,
-        )
-        session.add(archive)
+        days_ago = random.choices([7, 30, 90, 180, 365], cum_weights=days_ago_cum_weights)[0]
+        sold_at = now_utc - timedelta(days=random.randint(1, days_ago))
+
+        archive_rows.append({
+            "product_id": p.id,
+            "title": p.title,
+            "category_id": p.category_id,
+            "location_id": p.location_id,
+            "price_amount": p.price_amount,
+            "price_currency": p.price_currency,
+            "sold_at": sold_at,
+        })
+    if archive_rows:
+        session.execute(insert(SoldItemArchive), archive_rows)
     session.commit()
 
 
 def seed_favorites(session: Session, users, products):
+    favorite_rows = []
+    # Products are favorited by many users, so their age is worked out once each
+    now_utc = datetime.now(timezone.utc)
+    created_at_utc = {p.id: _as_utc(p.created_at) for p in products}
+    num_favs_cum_weights = list(accumulate([0.2, 0.2, 0.25, 0.2, 0.1, 0.05]))
     for u in users:
         other_products = [p for p in products if p.seller_id != u.id]
         if other_products:
-            num_favs = random.choices([0, 1, 2, 3, 4, 5], weights=[0.2, 0.2, 0.25, 0.2, 0.1, 0.05])[0]
+            num_favs = random.choices([0, 1, 2, 3, 4, 5], cum_weights=num_favs_cum_weights)[0]
             favs = random.sample(other_products, k=min(num_favs, len(other_products)))
             for p in favs:
-                # Ensure both datetimes are timezone-aware
-                now_utc = datetime.now(timezone.utc)
-                created_at_utc = p.created_at.replace(tzinfo=timezone.utc) if p.created_at.tzinfo is None else p.created_at
-                days_since_creation = max(0, (now_utc - created_at_utc).days)
+                days_since_creation = max(0, (now_utc - created_at_utc[p.id]).days)
                 days_after = random.randint(0, days_since_creation)
-                fav_date = created_at_utc + timedelta(days=days_after)
-                fav = Favorite(user=u, product=p, created_at=fav_date)
-                session.add(fav)
+                fav_date = created_at_utc[p.id] + timedelta(days=days_after)
+                favorite_rows.append({"user_id": u.id, "product_id": p.id, "created_at": fav_date})
+    if favorite_rows:
+        session.execute(insert(Favorite), favorite_rows)
     session.commit()
 
 
 def seed_views(session: Session, users, products):
-    for p in products:
-        potential_viewers = [u for u in users if u.id != p.seller_id and u.is_active]
-        if potential_viewers:
-            # Ensure both datetimes are timezone-aware for comparison
-            created_at_utc = p.created_at.replace(tzinfo=timezone.utc) if p.created_at.tzinfo is None else p.created_at
-            base_views = 2 if created_at_utc > datetime.now(timezone.utc) - timedelta(days=30) else 1
-            max_views = 15
-            view_range = list(range(base_views, max_views))
-            # Create weights that match the range length
-            num_options = len(view_range)
-            if num_options <= 5:
-                weights = [1.0 / num_options] * num_options
-            else:
-                # Favor lower numbers: decreasing weights
-                weights = [0.3, 0.25, 0.2, 0.15, 0.1] + [0.05] * (num_options - 5)
-            view_count = random.choices(view_range, weights=weights)[0]
-
-            for _ in range(view_count):
-                viewer = random.choice(potential_viewers)
-                # Ensure both datetimes are timezone-aware
-                now_utc = datetime.now(timezone.utc)
-                days_since_creation = max(0, (now_utc - created_at_utc).days)
-                days_after = random.randint(0, days_since_creation)
-                view_date = created_at_utc + timedelta(days=days_after)
+    view_rows = []
+    now_utc = datetime.now(timezone.utc)
+
+    # A product's view count distribution only depends on whether it is recent
+    # (base of 2 views) or not (base of 1), so both are built once up front
+    max_views = 15
+    view_count_distributions = {}
+    for base_views in (1, 2):
+        view_range = list(range(base_views, max_views))
+        # Create weights that match the range length
+        num_options = len(view_range)
+        if num_options <= 5:
+            weights = [1.0 / num_options] * num_options
+        else:
+            # Favor lower numbers: decreasing weights
+            weights = [0.3, 0.25, 0.2, 0.15, 0.1] + [0.05] * (num_options - 5)
+        view_count_distributions[base_views] = (view_range, list(accumulate(weights)))
 
-                view = ItemView(
-                    product=p,
-                    viewer_user_id=viewer.id,
-                    viewed_at=view_date,
-                )
-                session.add(view)
+    # Active viewer ids are collected once; each product samples one extra id so
+    # its seller can be dropped without building a per-product viewer list
+    active_viewer_ids = [u.id for u in users if u.is_active]
+
+    for p in products:
+        created_at_utc = _as_utc(p.created_at)
+        days_since_creation = max(0, (now_utc - created_at_utc).days)
+        base_views = 2 if created_at_utc > now_utc - timedelta(days=30) else 1
+        view_range, view_cum_weights = view_count_distributions[base_views]
+        view_count = random.choices(view_range, cum_weights=view_cum_weights)[0]
+
+        # Each signed-in viewer counts once per product (uq_item_views_product_viewer)
+        sampled_ids = random.sample(active_viewer_ids, k=min(view_count + 1, len(active_viewer_ids)))
+        viewer_ids = [viewer_id for viewer_id in sampled_ids if viewer_id != p.seller_id][:view_count]
+        for viewer_id in viewer_ids:
+            days_after = random.randint(0, days_since_creation)
+            view_date = created_at_utc + timedelta(days=days_after)
+
+            view_rows.append({"product_id": p.id, "viewer_user_id": viewer_id, "viewed_at": view_date})
+    if view_rows:
+        session.execute(insert(ItemView), view_rows)
     session.commit()
 
 
 def seed_conversations(session: Session, users, products):
     active_products = [p for p in products if p.status == "active"]
     conversation_count = min(len(active_products) // 8, 25)  # ~12% of products have conversations
+    participant_rows = []
+    message_rows = []
+    now_utc = datetime.now(timezone.utc)
 
     for p in random.sample(active_products, k=conversation_count):
         buyer = random.choice([u for u in users if u.id != p.seller_id and u.is_active])
 
         # Conversation should start after product creation
-        # Ensure both datetimes are timezone-aware
-        now_utc = datetime.now(timezone.utc)
-        created_at_utc = p.created_at.replace(tzinfo=timezone.utc) if p.created_at.tzinfo is None else p.created_at
+        created_at_utc = _as_utc(p.created_at)
         days_since_creation = max(0, (now_utc - created_at_utc).days)
         days_after = random.randint(0, days_since_creation)
         convo_start = created_at_utc + timedelta(days=days_after)
@@ -593,7 +674,7 @@ def seed_conversations(session: Session, users, products):
 
         participants = [p.seller, buyer]
         for u in participants:
-            session.add(ConversationParticipant(conversation=convo, user=u))
+            participant_rows.append({"conversation_id": convo.id, "user_id": u.id})
 
         # Realistic message patterns for seeding
         message_templates = [
@@ -632,6 +713,8 @@ def seed_conversations(session: Session, users, products):
         # Generate conversation with 2-8 messages
         message_count = random.randint(2, 8)
         current_time = convo_start
+        title_words = p.title.split()
+        product_word = title_words[1] if len(title_words) > 1 else p.title
 
         for i in range(message_count):
             sender = participants[i % 2]  # Alternate between buyer and seller
@@ -641,13 +724,13 @@ def seed_conversations(session: Session, users, products):
             if i == 0:
                 # First message from buyer
                 body = random.choice(message_templates).format(
-                    product=p.title.split()[1] if len(p.title.split()) > 1 else p.title,
+                    product=product_word,
                     location=p.location.city,
                 )
             else:
                 # Responses
                 body = random.choice(response_templates).format(
-                    product=p.title.split()[1] if len(p.title.split()) > 1 else p.title,
+                    product=product_word,
                     condition=p.condition.replace('_', ' '),
                     price=p.price_amount,
                     fixed=" (fixed price)" if p.price_type == "fixed" else " (negotiable)",
@@ -658,15 +741,17 @@ def seed_conversations(session: Session, users, products):
                     best_price=int(float(p.price_amount) * random.uniform(0.85, 0.95))
                 )
 
-            msg = Message(
-                conversation_id=convo.id,
-                sender_id=sender.id,
-                body=body,
-                created_at=current_time,
-            )
-            session.add(msg)
+            message_rows.append({
+                "conversation_id": convo.id,
+                "sender_id": sender.id,
+                "body": body,
+                "created_at": current_time,
+            })
         # Keep conversation ordering aligned with most recent message
         convo.updated_at = current_time
+    if participant_rows:
+        session.execute(insert(ConversationParticipant), participant_rows)
+        session.execute(insert(Message), message_rows)
     session.commit()
 
 
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock
 from fastapi import HTTPException
 
 from app.models.product import Product
+from app.schemas.message_schema import MessageOut
 from app.services.message_service import MessageService
 
 
@@ -21,10 +22,7 @@ def make_message(msg_id=100, sender_id=1, deleted_at=None):
 
 def setup_db_with_product(product: Product | None):
     db = MagicMock()
-    query = MagicMock()
-    query.filter.return_value = query
-    query.first.return_value = product
-    db.query.return_value = query
+    db.get.return_value = product
     return db
 
 
@@ -118,8 +116,7 @@ def test_start_conversation_adds_participants_and_message(message_repo):
     message_repo.add_participant.assert_any_call(conv.id, 2)
     message_repo.create_message.assert_called_once_with(conv.id, 1, "hello")
     message_repo.commit.assert_called_once()
-    db.refresh.assert_any_call(conv)
-    db.refresh.assert_any_call(first_msg)
+    db.refresh.assert_not_called()
 
 
 def test_send_message_requires_participant(message_repo):
@@ -135,97 +132,108 @@ def test_send_message_requires_participant(message_repo):
     message_repo.create_message.assert_not_called()
 
 
-def test_send_message_success(message_repo):
+def test_send_message_returns_serializable_detached_message():
     db = MagicMock()
+    # The flush assigns the primary key; everything else must already be set on the row
+    db.flush.side_effect = lambda: setattr(db.add.call_args.args[0], "id", 10)
     service = MessageService(db)
-    service.message_repo = message_repo
-    message_repo.is_participant.return_value = True
-    msg = make_message(10, sender_id=1)
-    message_repo.create_message.return_value = msg
+    service.message_repo.is_participant = MagicMock(return_value=True)
 
     result = service.send_message(conversation_id=1, sender_id=1, body="hi")
 
-    assert result is msg
-    message_repo.create_message.assert_called_once_with(1, 1, "hi")
-    message_repo.commit.assert_called_once()
-    db.refresh.assert_called_once_with(msg)
+    db.expunge.assert_called_once_with(result)
+    db.commit.assert_called_once()
+    db.refresh.assert_not_called()
+    out = MessageOut.model_validate(result)
+    assert (out.id, out.conversation_id, out.sender_id, out.body) == (10, 1, 1, "hi")
+    assert out.created_at is not None
+    assert out.deleted_at is None
 
 
 def test_edit_message_missing_or_deleted_raises(message_repo):
     db = MagicMock()
     service = MessageService(db)
     service.message_repo = message_repo
+    message_repo.update_message.return_value = False
     message_repo.get_message_by_id.return_value = None
 
-    with pytest.raises(HTTPException):
+    with pytest.raises(HTTPException) as exc_info:
         service.edit_message(message_id=1, editor_id=1, new_body="x")
+    assert exc_info.value.status_code == 404
 
     message_repo.get_message_by_id.return_value = make_message(1, sender_id=1, deleted_at="now")
-    with pytest.raises(HTTPException):
+    with pytest.raises(HTTPException) as exc_info:
         service.edit_message(message_id=1, editor_id=1, new_body="x")
+    assert exc_info.value.status_code == 404
+    message_repo.commit.assert_not_called()
 
 
 def test_edit_message_wrong_editor_raises(message_repo):
     db = MagicMock()
     service = MessageService(db)
     service.message_repo = message_repo
+    message_repo.update_message.return_value = False
     message_repo.get_message_by_id.return_value = make_message(1, sender_id=2)
 
-    with pytest.raises(HTTPException):
+    with pytest.raises(HTTPException) as exc_info:
         service.edit_message(message_id=1, editor_id=1, new_body="x")
+    assert exc_info.value.status_code == 403
 
 
 def test_edit_message_success(message_repo):
     db = MagicMock()
     service = MessageService(db)
     service.message_repo = message_repo
-    msg = make_message(1, sender_id=1)
-    message_repo.get_message_by_id.return_value = msg
+    message_repo.update_message.return_value = True
     updated = make_message(1, sender_id=1)
-    message_repo.update_message.return_value = updated
+    message_repo.get_message_by_id.return_value = updated
 
     result = service.edit_message(message_id=1, editor_id=1, new_body="updated")
 
     assert result is updated
-    message_repo.update_message.assert_called_once_with(1, "updated")
+    message_repo.update_message.assert_called_once_with(1, 1, "updated")
     message_repo.commit.assert_called_once()
-    db.refresh.assert_called_once_with(updated)
+    message_repo.get_message_by_id.assert_called_once_with(1)
+    db.refresh.assert_not_called()
 
 
 def test_delete_message_missing_or_deleted_noop(message_repo):
     db = MagicMock()
     service = MessageService(db)
     service.message_repo = message_repo
+    message_repo.soft_delete_message.return_value = False
     message_repo.get_message_by_id.return_value = None
 
     service.delete_message(message_id=1, requester_id=1)
-    message_repo.soft_delete_message.assert_not_called()
 
     message_repo.get_message_by_id.return_value = make_message(1, sender_id=1, deleted_at="now")
     service.delete_message(message_id=1, requester_id=1)
-    message_repo.soft_delete_message.assert_not_called()
+    message_repo.commit.assert_not_called()
 
 
 def test_delete_message_wrong_user_raises(message_repo):
     db = MagicMock()
     service = MessageService(db)
     service.message_repo = message_repo
+    message_repo.soft_delete_message.return_value = False
     message_repo.get_message_by_id.return_value = make_message(1, sender_id=2)
 
-    with pytest.raises(HTTPException):
+    with pytest.raises(HTTPException) as exc_info:
         service.delete_message(message_id=1, requester_id=1)
+    assert exc_info.value.status_code == 403
 
 
 def test_delete_message_success(message_repo):
     db = MagicMock()
     service = MessageService(db)
     service.message_repo = message_repo
-    message_repo.get_message_by_id.return_value = make_message(1, sender_id=1)
+    message_repo.soft_delete_message.return_value = True
 
     service.delete_message(message_id=1, requester_id=1)
 
-    message_repo.soft_delete_message.assert_called_once_with(1)
+    message_repo.soft_delete_message.assert_called_once_with(1, 1)
     message_repo.commit.assert_called_once()
+    message_repo.get_message_by_id.assert_not_called()
 
 
 def test_get_unread_count_delegates(message_repo):
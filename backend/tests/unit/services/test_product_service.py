@@ -3,12 +3,19 @@ from datetime import datetime, timezone
 from decimal import Decimal
 from types import SimpleNamespace
 from fastapi import HTTPException, status
+from sqlalchemy import inspect
+from sqlalchemy.dialects import mysql
+from sqlalchemy.orm import Session
 from unittest.mock import AsyncMock, MagicMock, call
 
+from app.models.product_details import Color
 from app.repositories.base import ProductRepositoryInterface, UserRepositoryInterface
-from app.schemas.product_schema import ProductCreate, ProductUpdate
+from app.repositories.product_repository import ProductRepository, _prefix_search_terms
+from app.schemas.product_schema import ProductCreate, ProductFilter, ProductUpdate
 from app.services.file_upload_service import FileUploadService
-from app.services.product_service import ProductService
+from app.services.product_service import (
+    ProductService, clear_product_response_cache, clear_reference_data_cache
+)
 
 
 def make_product(**overrides):
@@ -46,6 +53,15 @@ def make_product(**overrides):
     return SimpleNamespace(**base)
 
 
+@pytest.fixture(autouse=True)
+def empty_service_caches():
+    clear_product_response_cache()
+    clear_reference_data_cache()
+    yield
+    clear_product_response_cache()
+    clear_reference_data_cache()
+
+
 @pytest.fixture
 def product_repository():
     return MagicMock(spec=ProductRepositoryInterface)
@@ -128,6 +144,54 @@ async def test_create_product_failure_cleans_up_images(product_service, product_
     file_upload_service.delete_images.assert_awaited_once_with(["tmp1"])
 
 
+def test_get_all_categories_is_cached(product_service, product_repository):
+    product_repository.get_all_categories.return_value = [SimpleNamespace(id=1, name="Road Bikes")]
+
+    first = product_service.get_all_categories()
+    second = product_service.get_all_categories()
+
+    assert second is first
+    assert [cat.name for cat in first] == ["Road Bikes"]
+    product_repository.get_all_categories.assert_called_once()
+
+
+def test_get_all_details_is_cached(product_service, product_repository):
+    product_repository.get_product_details_options.return_value = {
+        "colors": [SimpleNamespace(id=1, name="Red")],
+        "materials": [SimpleNamespace(id=2, name="Steel")],
+        "tags": [],
+    }
+
+    product_service.get_all_details()
+    details = product_service.get_all_details()
+
+    assert details["colors"][0].name == "Red"
+    assert details["materials"][0].name == "Steel"
+    assert details["tags"] == ()
+    product_repository.get_product_details_options.assert_called_once()
+
+
+def test_get_all_details_reloads_after_color_write_is_committed(product_service, product_repository):
+    product_repository.get_product_details_options.return_value = {
+        "colors": [], "materials": [], "tags": []
+    }
+
+    session = Session()
+    color = Color(name="Teal")
+    session.add(color)
+
+    product_service.get_all_details()
+    Color.__mapper__.dispatch.after_insert(Color.__mapper__, None, inspect(color))
+    product_service.get_all_details()
+    # Until the writing session commits, readers keep the cached options
+    assert product_repository.get_product_details_options.call_count == 1
+
+    session.dispatch.after_commit(session)
+    product_service.get_all_details()
+
+    assert product_repository.get_product_details_options.call_count == 2
+
+
 def test_get_product_by_id_returns_none_when_not_found(product_service, product_repository):
     product_repository.get_by_id.return_value = None
 
@@ -138,7 +202,7 @@ def test_get_product_by_id_returns_none_when_not_found(product_service, product_
 
 
 def test_get_product_by_id_inactive_for_other_user_returns_none(product_service, product_repository):
-    product_repository.get_by_id.return_value = SimpleNamespace(status="draft", seller_id=5)
+    product_repository.get_by_id.return_value = make_product(status="draft", seller_id=5)
 
     result = product_service.get_product_by_id(1, current_user_id=10)
 
@@ -146,19 +210,72 @@ def test_get_product_by_id_inactive_for_other_user_returns_none(product_service,
     product_repository.record_view.assert_not_called()
 
 
-def test_get_product_by_id_records_view_and_reloads(product_service, product_repository):
-    product = make_product(status="active", seller_id=10)
-    product_reloaded = make_product(status="active", seller_id=10)
-    product_repository.get_by_id.side_effect = [product, product_reloaded]
+def test_get_product_by_id_records_view_without_reloading(product_service, product_repository):
+    product = make_product(id=101, status="active", seller_id=10, views_count=4)
+    product_repository.get_by_id.return_value = product
+    product_repository.record_view.return_value = True
+
+    result = product_service.get_product_by_id(101, current_user_id=20)
+
+    assert result.id == product.id
+    assert result.views_count == 5
+    assert product_repository.record_view.call_args == call(101, 20)
+    product_repository.get_by_id.assert_called_once_with(101, load_details=True)
+
+
+def test_get_product_by_id_repeat_view_keeps_count(product_service, product_repository):
+    product = make_product(id=102, status="active", seller_id=10, views_count=4)
+    product_repository.get_by_id.return_value = product
+    product_repository.record_view.return_value = False
+
+    result = product_service.get_product_by_id(102, current_user_id=20)
+
+    assert result.views_count == 4
+
+
+def test_get_product_by_id_is_cached_until_product_is_updated(product_service, product_repository):
+    product = make_product(id=103, status="active", seller_id=10)
+    product_repository.get_by_id.return_value = product
 
-    result = product_service.get_product_by_id(1, current_user_id=20)
+    first = product_service.get_product_by_id(103, current_user_id=10)
+    second = product_service.get_product_by_id(103, current_user_id=10)
+    assert second is first
+    product_repository.get_by_id.assert_called_once_with(103, load_details=True)
 
-    assert result.id == product_reloaded.id
-    assert product_repository.record_view.call_args == call(1, 20)
-    assert product_repository.get_by_id.call_args_list == [
-        call(1, load_details=True),
-        call(1, load_details=True),
-    ]
+    product_repository.get_auth_fields.return_value = SimpleNamespace(seller_id=10, price_amount=Decimal("10.00"), status="active")
+    product_repository.update.return_value = (make_product(id=103, status="paused", seller_id=10), [])
+    product_service.toggle_product_status(103, user_id=10)
+    product.status = "paused"
+
+    third = product_service.get_product_by_id(103, current_user_id=10)
+    assert third.status == "paused"
+
+
+def test_get_products_serves_repeat_pages_from_cache(product_service, product_repository):
+    product_repository.get_page_with_total.return_value = ([make_product(id=104)], 1)
+    filters = ProductFilter(status="active")
+
+    first = product_service.get_products(skip=0, limit=15, filter_params=filters)
+    second = product_service.get_products(skip=0, limit=15, filter_params=ProductFilter(status="active"))
+
+    assert second == first
+    assert first[0][0].id == 104
+    product_repository.get_page_with_total.assert_called_once()
+
+    product_service.get_products(skip=15, limit=15, filter_params=filters)
+    assert product_repository.get_page_with_total.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_delete_product_drops_cached_pages(product_service, product_repository):
+    product_repository.get_page_with_total.return_value = ([make_product(id=105)], 1)
+    product_repository.get_auth_fields.return_value = SimpleNamespace(seller_id=1, price_amount=None, status="active")
+    product_service.get_products(skip=0, limit=15)
+
+    await product_service.delete_product(105, user_id=1)
+    product_service.get_products(skip=0, limit=15)
+
+    assert product_repository.get_page_with_total.call_count == 2
 
 
 def test_get_product_by_id_allows_owner_when_inactive(product_service, product_repository):
@@ -173,7 +290,7 @@ def test_get_product_by_id_allows_owner_when_inactive(product_service, product_r
 
 @pytest.mark.asyncio
 async def test_update_product_not_found_raises(product_service, product_repository):
-    product_repository.get_by_id.return_value = None
+    product_repository.get_auth_fields.return_value = None
 
     with pytest.raises(HTTPException) as exc_info:
         await product_service.update_product(1, ProductUpdate(title="x"), user_id=1)
@@ -184,7 +301,7 @@ async def test_update_product_not_found_raises(product_service, product_reposito
 
 @pytest.mark.asyncio
 async def test_update_product_forbidden_for_non_owner(product_service, product_repository):
-    product_repository.get_by_id.return_value = SimpleNamespace(seller_id=1)
+    product_repository.get_auth_fields.return_value = SimpleNamespace(seller_id=1)
 
     with pytest.raises(HTTPException) as exc_info:
         await product_service.update_product(1, ProductUpdate(title="x"), user_id=2, is_admin=False)
@@ -195,7 +312,7 @@ async def test_update_product_forbidden_for_non_owner(product_service, product_r
 
 @pytest.mark.asyncio
 async def test_update_product_success_deletes_old_images(product_service, product_repository, file_upload_service):
-    product_repository.get_by_id.return_value = SimpleNamespace(seller_id=1)
+    product_repository.get_auth_fields.return_value = SimpleNamespace(seller_id=1)
     file_upload_service.validate_and_save_images = AsyncMock(return_value=["new1"])
     updated_product = SimpleNamespace(id=1)
     product_repository.update.return_value = (updated_product, ["old1"])
@@ -214,7 +331,7 @@ async def test_update_product_success_deletes_old_images(product_service, produc
 
 @pytest.mark.asyncio
 async def test_update_product_repo_returns_none_raises_500(product_service, product_repository):
-    product_repository.get_by_id.return_value = SimpleNamespace(seller_id=1)
+    product_repository.get_auth_fields.return_value = SimpleNamespace(seller_id=1)
     product_repository.update.return_value = (None, [])
 
     with pytest.raises(HTTPException) as exc_info:
@@ -225,7 +342,7 @@ async def test_update_product_repo_returns_none_raises_500(product_service, prod
 
 @pytest.mark.asyncio
 async def test_update_product_exception_cleans_up_new_images(product_service, product_repository, file_upload_service):
-    product_repository.get_by_id.return_value = SimpleNamespace(seller_id=1)
+    product_repository.get_auth_fields.return_value = SimpleNamespace(seller_id=1)
     file_upload_service.validate_and_save_images = AsyncMock(return_value=["new1"])
     product_repository.update.side_effect = ValueError("explode")
 
@@ -237,7 +354,8 @@ async def test_update_product_exception_cleans_up_new_images(product_service, pr
 
 @pytest.mark.asyncio
 async def test_delete_product_not_found_raises(product_service, product_repository):
-    product_repository.get_by_id.return_value = None
+    product_repository.soft_delete.return_value = False
+    product_repository.get_auth_fields.return_value = None
 
     with pytest.raises(HTTPException) as exc_info:
         await product_service.delete_product(1, user_id=1)
@@ -247,24 +365,26 @@ async def test_delete_product_not_found_raises(product_service, product_reposito
 
 @pytest.mark.asyncio
 async def test_delete_product_forbidden_for_non_owner(product_service, product_repository):
-    product_repository.get_by_id.return_value = SimpleNamespace(seller_id=2)
+    product_repository.soft_delete.return_value = False
+    product_repository.get_auth_fields.return_value = SimpleNamespace(seller_id=2)
 
     with pytest.raises(HTTPException) as exc_info:
         await product_service.delete_product(1, user_id=1)
 
     assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
-    product_repository.soft_delete.assert_not_called()
+    product_repository.soft_delete.assert_called_once_with(1, 1)
 
 
 @pytest.mark.asyncio
 async def test_delete_product_success_calls_soft_delete(product_service, product_repository):
-    product_repository.get_by_id.return_value = SimpleNamespace(seller_id=1)
     product_repository.soft_delete.return_value = True
 
     result = await product_service.delete_product(1, user_id=1)
 
     assert result is True
-    product_repository.soft_delete.assert_called_once_with(1)
+    product_repository.soft_delete.assert_called_once_with(1, 1)
+    product_repository.get_auth_fields.assert_not_called()
+    product_repository.get_by_id.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -287,7 +407,7 @@ async def test_force_delete_product_deletes_images(product_service, product_repo
 
 
 def test_mark_product_as_sold_forbidden_for_non_owner(product_service, product_repository):
-    product_repository.get_by_id.return_value = SimpleNamespace(seller_id=1)
+    product_repository.get_auth_fields.return_value = SimpleNamespace(seller_id=1)
 
     with pytest.raises(HTTPException) as exc_info:
         product_service.mark_product_as_sold(1, user_id=2, is_admin=False)
@@ -297,7 +417,7 @@ def test_mark_product_as_sold_forbidden_for_non_owner(product_service, product_r
 
 
 def test_mark_product_as_sold_missing_product_raises(product_service, product_repository):
-    product_repository.get_by_id.return_value = None
+    product_repository.get_auth_fields.return_value = None
 
     with pytest.raises(HTTPException) as exc_info:
         product_service.mark_product_as_sold(1, user_id=2)
@@ -306,7 +426,7 @@ def test_mark_product_as_sold_missing_product_raises(product_service, product_re
 
 
 def test_toggle_product_status_active_to_paused(product_service, product_repository):
-    product_repository.get_by_id.return_value = make_product(status="active", seller_id=1)
+    product_repository.get_auth_fields.return_value = make_product(status="active", seller_id=1)
     updated_product = make_product(status="paused", seller_id=1)
     product_repository.update.return_value = (updated_product, [])
 
@@ -317,7 +437,7 @@ def test_toggle_product_status_active_to_paused(product_service, product_reposit
 
 
 def test_toggle_product_status_unauthorized(product_service, product_repository):
-    product_repository.get_by_id.return_value = SimpleNamespace(seller_id=1, status="active")
+    product_repository.get_auth_fields.return_value = SimpleNamespace(seller_id=1, status="active")
 
     with pytest.raises(HTTPException) as exc_info:
         product_service.toggle_product_status(1, user_id=2)
@@ -326,7 +446,7 @@ def test_toggle_product_status_unauthorized(product_service, product_repository)
 
 
 def test_toggle_product_status_missing_product_raises(product_service, product_repository):
-    product_repository.get_by_id.return_value = None
+    product_repository.get_auth_fields.return_value = None
 
     with pytest.raises(HTTPException) as exc_info:
         product_service.toggle_product_status(1, user_id=1)
@@ -513,6 +633,23 @@ class TestSearchProductsValidation:
         assert isinstance(result, list)
         product_repository.search_by_title.assert_called_once()
 
+    def test_search_terms_skip_words_the_fulltext_index_does_not_hold(self):
+        """EP: Short words and stopwords are not required FULLTEXT terms"""
+        assert _prefix_search_terms("a red bike") == "+red* +bike*"
+        assert _prefix_search_terms("TV in the box") == "+box*"
+
+    def test_search_by_title_short_word_falls_back_to_ilike(self):
+        """EP: A search of only short words (tv) matches by substring, not FULLTEXT"""
+        db = MagicMock(spec=Session)
+        products = db.query.return_value.options.return_value.filter.return_value
+
+        ProductRepository(db).search_by_title("tv")
+
+        (criterion,), _ = products.filter.call_args
+        compiled = str(criterion.compile(dialect=mysql.dialect()))
+        assert "MATCH" not in compiled
+        assert "LIKE" in compiled
+
     @pytest.mark.parametrize("malicious_input", [
         "' OR 1=1",                    # SQL injection attempt
         "'; DROP TABLE products; --", # SQL injection
@@ -521,20 +658,23 @@ class TestSearchProductsValidation:
         "%'; DELETE FROM users; --",  # SQL with wildcards
     ])
     def test_search_security_sanitization(self, malicious_input, product_service, product_repository):
-        """EP: Security attacks are sanitized and handled safely"""
-        # Service should sanitize and search safely without executing malicious code
+        """EP: Security attacks are passed through verbatim for parameter binding"""
         product_repository.search_by_title.return_value = []
         
         result = product_service.search_products(malicious_input)
         
         # Should return empty results or safe results, not execute malicious code
         assert isinstance(result, list)
-        # Verify the repository was called (meaning sanitization happened in service)
-        product_repository.search_by_title.assert_called_once()
+        # The repository binds the term as a parameter, so it must arrive unmodified
+        product_repository.search_by_title.assert_called_once_with(malicious_input, 0, 20)
+
+    def test_search_keeps_ampersand_literal(self, product_service, product_repository):
+        """EP: Terms containing '&' are not HTML-escaped before searching"""
+        product_repository.search_by_title.return_value = []
+        
+        product_service.search_products("  Bike & Helmet  ")
         
-        # Verify the actual call - the service should pass the sanitized input
-        call_args = product_repository.search_by_title.call_args
-        assert call_args is not None
+        product_repository.search_by_title.assert_called_once_with("Bike & Helmet", 0, 20)
 
     def test_search_with_unicode_characters(self, product_service, product_repository):
         """EP: Search with unicode characters succeeds"""
@@ -613,25 +753,39 @@ class TestPaginationValidation:
         product_repository.search_by_title.assert_called_once_with("test", 0, 20)
         assert isinstance(result, list)
 
+    def test_get_products_uses_single_paged_query(self, product_service, product_repository):
+        """EP: get_products returns the page and total from one repository call"""
+        filters = ProductFilter(status="active")
+        product_repository.get_page_with_total.return_value = ([make_product()], 42)
+        
+        products, total = product_service.get_products(skip=15, limit=15, filter_params=filters)
+        
+        product_repository.get_page_with_total.assert_called_once_with(
+            filters=filters, skip=15, limit=15, sort_field=None, sort_direction='desc'
+        )
+        product_repository.count_filtered.assert_not_called()
+        assert total == 42
+        assert len(products) == 1
+
     def test_get_products_by_seller_pagination(self, product_service, product_repository):
         """EP: get_products_by_seller respects skip/limit"""
-        product_repository.get_by_seller.return_value = [make_product()]
-        product_repository.count_by_seller.return_value = 100
+        product_repository.get_by_seller_with_total.return_value = ([make_product()], 100)
         
         products, total = product_service.get_products_by_seller(seller_id=1, skip=30, limit=30)
         
-        product_repository.get_by_seller.assert_called_once_with(1, 30, 30)
+        product_repository.get_by_seller_with_total.assert_called_once_with(1, 30, 30)
+        product_repository.count_by_seller.assert_not_called()
         assert total == 100
         assert isinstance(products, list)
 
     def test_get_products_by_category_pagination(self, product_service, product_repository):
         """EP: get_products_by_category respects skip/limit"""
-        product_repository.get_by_category.return_value = [make_product()]
+        product_repository.get_by_category_with_total.return_value = ([make_product()], 51)
         
         products, total = product_service.get_products_by_category(category="electronics", skip=50, limit=25)
         
-        # Called twice: once for paginated results, once for count
-        assert product_repository.get_by_category.call_count == 2
-        first_call = product_repository.get_by_category.call_args_list[0]
-        assert first_call[0] == ("electronics", 50, 25)
+        # Page and total come from a single repository call
+        product_repository.get_by_category_with_total.assert_called_once_with("electronics", 50, 25)
+        product_repository.get_by_category.assert_not_called()
+        assert total == 51
         assert isinstance(products, list)
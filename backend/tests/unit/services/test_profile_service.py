@@ -11,7 +11,8 @@ from app.repositories.base import (
 )
 from app.schemas.location_schema import LocationCreate
 from app.schemas.user_schema import ProfileUpdate
-from app.services.profile_service import ProfileService
+from app.services import product_service
+from app.services.profile_service import ProfileService, clear_public_profile_cache
 
 
 def make_user(**overrides):
@@ -36,6 +37,13 @@ def make_product(product_id=1, seller_id=1):
     return SimpleNamespace(id=product_id, seller_id=seller_id)
 
 
+@pytest.fixture(autouse=True)
+def empty_profile_cache():
+    clear_public_profile_cache()
+    yield
+    clear_public_profile_cache()
+
+
 @pytest.fixture
 def user_repository():
     return MagicMock(spec=UserRepositoryInterface)
@@ -58,19 +66,18 @@ def profile_service(user_repository, product_repository, location_repository):
 
 def test_get_user_profile_success(profile_service, user_repository, product_repository):
     user = make_user()
-    user_repository.get_by_id.return_value = user
-    product_repository.count_by_seller.return_value = 3
+    user_repository.get_with_product_count.return_value = (user, 3)
 
     profile = profile_service.get_user_profile(1)
 
     assert profile.id == user.id
     assert profile.product_count == 3
-    user_repository.get_by_id.assert_called_once_with(1)
-    product_repository.count_by_seller.assert_called_once_with(1)
+    user_repository.get_with_product_count.assert_called_once_with(1)
+    product_repository.count_by_seller.assert_not_called()
 
 
 def test_get_user_profile_not_found(profile_service, user_repository):
-    user_repository.get_by_id.return_value = None
+    user_repository.get_with_product_count.return_value = None
 
     with pytest.raises(HTTPException) as exc_info:
         profile_service.get_user_profile(99)
@@ -80,8 +87,7 @@ def test_get_user_profile_not_found(profile_service, user_repository):
 
 def test_get_public_profile_success(profile_service, user_repository, product_repository):
     user = make_user()
-    user_repository.get_by_id.return_value = user
-    product_repository.count_by_seller.return_value = 5
+    user_repository.get_with_product_count.return_value = (user, 5)
 
     public_profile = profile_service.get_public_profile(1)
 
@@ -90,8 +96,23 @@ def test_get_public_profile_success(profile_service, user_repository, product_re
     assert public_profile.product_count == 5
 
 
+def test_get_public_profile_is_cached_until_profile_is_updated(profile_service, user_repository):
+    user_repository.get_with_product_count.return_value = (make_user(full_name="Before"), 2)
+
+    first = profile_service.get_public_profile(1)
+    second = profile_service.get_public_profile(1)
+    assert second is first
+    user_repository.get_with_product_count.assert_called_once_with(1)
+
+    user_repository.update.return_value = make_user(full_name="After")
+    profile_service.update_profile(1, ProfileUpdate(full_name="After"))
+    user_repository.get_with_product_count.return_value = (make_user(full_name="After"), 2)
+
+    assert profile_service.get_public_profile(1).full_name == "After"
+
+
 def test_get_public_profile_inactive_raises(profile_service, user_repository):
-    user_repository.get_by_id.return_value = make_user(is_active=False)
+    user_repository.get_with_product_count.return_value = (make_user(is_active=False), 0)
 
     with pytest.raises(HTTPException) as exc_info:
         profile_service.get_public_profile(1)
@@ -100,7 +121,7 @@ def test_get_public_profile_inactive_raises(profile_service, user_repository):
 
 
 def test_get_public_profile_missing_user(profile_service, user_repository):
-    user_repository.get_by_id.return_value = None
+    user_repository.get_with_product_count.return_value = None
 
     with pytest.raises(HTTPException) as exc_info:
         profile_service.get_public_profile(1)
@@ -194,7 +215,6 @@ def test_remove_user_location_update_failed(profile_service, user_repository):
 
 
 def test_get_user_products_success(profile_service, user_repository, product_repository):
-    user_repository.get_by_id.return_value = make_user()
     products = [make_product(1), make_product(2)]
     product_repository.get_by_seller.return_value = products
 
@@ -202,10 +222,20 @@ def test_get_user_products_success(profile_service, user_repository, product_rep
 
     assert result == products
     product_repository.get_by_seller.assert_called_once_with(1, 2, 5)
+    user_repository.get_by_id.assert_not_called()
+
+
+def test_get_user_products_empty_page_for_existing_user(profile_service, user_repository, product_repository):
+    user_repository.get_by_id.return_value = make_user()
+    product_repository.get_by_seller.return_value = []
+
+    assert profile_service.get_user_products(1) == []
+    user_repository.get_by_id.assert_called_once_with(1)
 
 
-def test_get_user_products_missing_user(profile_service, user_repository):
+def test_get_user_products_missing_user(profile_service, user_repository, product_repository):
     user_repository.get_by_id.return_value = None
+    product_repository.get_by_seller.return_value = []
 
     with pytest.raises(HTTPException) as exc_info:
         profile_service.get_user_products(1)
@@ -215,8 +245,7 @@ def test_get_user_products_missing_user(profile_service, user_repository):
 
 def test_get_user_statistics_success(profile_service, user_repository, product_repository):
     user = make_user(location_id=7, is_active=True, created_at=datetime(2024, 1, 1, tzinfo=timezone.utc))
-    user_repository.get_by_id.return_value = user
-    product_repository.count_by_seller.return_value = 4
+    user_repository.get_with_product_count.return_value = (user, 4)
 
     stats = profile_service.get_user_statistics(1)
 
@@ -229,7 +258,7 @@ def test_get_user_statistics_success(profile_service, user_repository, product_r
 
 
 def test_get_user_statistics_missing_user(profile_service, user_repository):
-    user_repository.get_by_id.return_value = None
+    user_repository.get_with_product_count.return_value = None
 
     with pytest.raises(HTTPException) as exc_info:
         profile_service.get_user_statistics(1)
@@ -239,40 +268,37 @@ def test_get_user_statistics_missing_user(profile_service, user_repository):
 
 def test_delete_user_account_success(profile_service, user_repository, product_repository):
     user_repository.get_by_id.return_value = make_user()
-    product_repository.get_by_seller.return_value = [make_product(1), make_product(2)]
-    product_repository.delete.return_value = True
     user_repository.delete.return_value = True
 
     result = profile_service.delete_user_account(1)
 
     assert result is True
-    assert product_repository.delete.call_count == 2
     user_repository.delete.assert_called_once_with(1)
 
 
-def test_delete_user_account_missing_user(profile_service, user_repository):
-    user_repository.get_by_id.return_value = None
+def test_delete_user_account_drops_cached_products(profile_service, user_repository, product_repository):
+    user_repository.get_by_id.return_value = make_user()
+    user_repository.delete.return_value = True
+    product_service._product_detail_cache.set(7, "cached detail")
+    product_service._product_page_cache.set("page", "cached page")
 
-    with pytest.raises(HTTPException) as exc_info:
-        profile_service.delete_user_account(1)
+    profile_service.delete_user_account(1)
 
-    assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+    assert product_service._product_detail_cache.get(7) is None
+    assert product_service._product_page_cache.get("page") is None
 
 
-def test_delete_user_account_product_delete_failed(profile_service, user_repository, product_repository):
-    user_repository.get_by_id.return_value = make_user()
-    product_repository.get_by_seller.return_value = [make_product(1)]
-    product_repository.delete.return_value = False
+def test_delete_user_account_missing_user(profile_service, user_repository):
+    user_repository.get_by_id.return_value = None
 
     with pytest.raises(HTTPException) as exc_info:
         profile_service.delete_user_account(1)
 
-    assert exc_info.value.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+    assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
 
 
 def test_delete_user_account_user_delete_failed(profile_service, user_repository, product_repository):
     user_repository.get_by_id.return_value = make_user()
-    product_repository.get_by_seller.return_value = []
     user_repository.delete.return_value = False
 
     with pytest.raises(HTTPException) as exc_info:
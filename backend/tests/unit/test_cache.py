@@ -0,0 +1,41 @@
+from unittest.mock import patch
+
+from app.cache import TTLCache
+
+
+def test_get_returns_value_until_ttl_expires():
+    cache = TTLCache(maxsize=4, ttl=60)
+
+    with patch("app.cache.monotonic", return_value=100.0):
+        cache.set("key", "value")
+    with patch("app.cache.monotonic", return_value=159.0):
+        assert cache.get("key") == "value"
+    with patch("app.cache.monotonic", return_value=160.0):
+        assert cache.get("key") is None
+
+
+def test_set_evicts_least_recently_used_entry():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_delete_and_clear_drop_entries():
+    cache = TTLCache(maxsize=4, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.delete("a")
+    cache.delete("missing")
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    cache.clear()
+    assert cache.get("b") is None
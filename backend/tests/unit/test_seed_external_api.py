@@ -4,15 +4,15 @@ from scripts.seed import fetch_unsplash_bike_image
 
 class TestUnsplashSeeding:
 
-    @patch('scripts.seed.requests.get')
+    @patch.dict('scripts.seed._image_pool', clear=True)
+    @patch('scripts.seed._HTTP.get')
     @patch('scripts.seed.random.choice')
     def test_fetch_unsplash_bike_image_success(self, mock_random_choice, mock_get):
         """
         Test that we correctly parse a valid 200 OK response from Unsplash.
         """
-        # Mock random.choice to return predictable values: style, base_term, title_word (but title_word is derived from title)
-        # Actually, random.choice is called for style, base_term, and results
-        mock_random_choice.side_effect = ["used", "road bike", {"urls": {"regular": "https://images.unsplash.com/photo-fake-bicycle.jpg"}}]
+        # Mock random.choice to return predictable values: style, base_term, then the pick from the pool
+        mock_random_choice.side_effect = ["used", "road bike", "https://images.unsplash.com/photo-fake-bicycle.jpg"]
         
         # 1. Arrange: Create a fake Unsplash response
         mock_api_response = {
@@ -32,8 +32,8 @@ class TestUnsplashSeeding:
         mock_get.return_value = mock_response_object
 
         # 2. Act: Call your function
-        # We pass a category and title to trigger the logic
-        image_url = fetch_unsplash_bike_image("road", "Speedster 3000")
+        # We pass a category name to trigger the logic
+        image_url = fetch_unsplash_bike_image("Road Bikes")
 
         # 3. Assert: Verify we got the URL from our fake data
         assert image_url == "https://images.unsplash.com/photo-fake-bicycle.jpg"
@@ -43,9 +43,28 @@ class TestUnsplashSeeding:
         assert "api.unsplash.com/search/photos" in args[0]
         assert "client_id=" in args[0]
         # Check for query in the URL
-        assert "used road bike speedster" in args[0]  # Based on mocked random choices
+        assert "used road bike" in args[0]  # Based on mocked random choices
 
-    @patch('scripts.seed.requests.get')
+    @patch.dict('scripts.seed._image_pool', clear=True)
+    @patch('scripts.seed._HTTP.get')
+    def test_fetch_unsplash_bike_image_searches_once_per_category(self, mock_get):
+        """
+        Test that later images of a category are picked from the first search's results.
+        """
+        mock_response_object = MagicMock()
+        mock_response_object.status_code = 200
+        mock_response_object.json.return_value = {
+            "results": [{"urls": {"regular": f"https://images.unsplash.com/photo-{i}.jpg"}} for i in range(3)]
+        }
+        mock_get.return_value = mock_response_object
+
+        image_urls = {fetch_unsplash_bike_image("Road Bikes") for _ in range(10)}
+
+        assert mock_get.call_count == 1
+        assert image_urls <= {f"https://images.unsplash.com/photo-{i}.jpg" for i in range(3)}
+
+    @patch.dict('scripts.seed._image_pool', clear=True)
+    @patch('scripts.seed._HTTP.get')
     @patch('scripts.seed.random.choice')
     def test_fetch_unsplash_bike_image_failure_fallback(self, mock_random_choice, mock_get):
         """
@@ -58,7 +77,7 @@ class TestUnsplashSeeding:
         mock_get.side_effect = Exception("Connection Timeout")
         
         # 2. Act
-        image_url = fetch_unsplash_bike_image("mountain", "Mountain King")
+        image_url = fetch_unsplash_bike_image("Mountain Bikes")
 
         # 3. Assert: It should return the mocked fallback
         assert image_url == "/images/mountain-bike.jpg"
\ No newline at end of file